@@ -0,0 +1,58 @@
+"""
+Benchmark the segmented sieve against the original list-based sieve
+
+Run from the repository root: python -m benchmarks.bench_sieve
+"""
+
+import argparse
+import time
+
+from whitehole.cosmology import generate_primes
+
+
+def legacy_generate_primes(n_max=100):
+    """Original list-of-booleans Sieve of Eratosthenes"""
+    is_prime = [True] * (n_max + 1)
+    is_prime[0] = is_prime[1] = False
+    for i in range(2, int(n_max**0.5) + 1):
+        if is_prime[i]:
+            for j in range(i*i, n_max + 1, i):
+                is_prime[j] = False
+    return [i for i in range(2, n_max + 1) if is_prime[i]]
+
+
+def best_of(func, *args, repeat=3):
+    """Best wall-clock time of several runs"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**5, 10**6, 10**7])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Also time the process-pool sieve with this many workers")
+    args = parser.parse_args()
+
+    print(f"{'n_max':>12} {'legacy [s]':>12} {'segmented [s]':>14} {'speedup':>9}")
+    for n_max in args.sizes:
+        legacy = best_of(legacy_generate_primes, n_max, repeat=args.repeat)
+        segmented = best_of(generate_primes, n_max, repeat=args.repeat)
+        print(f"{n_max:>12} {legacy:>12.4f} {segmented:>14.4f} {legacy / segmented:>8.1f}x")
+
+    if args.workers is not None:
+        print(f"\n{'n_max':>12} {'serial [s]':>12} {'parallel [s]':>14} {'speedup':>9}")
+        for n_max in args.sizes:
+            serial = best_of(generate_primes, n_max, repeat=args.repeat)
+            parallel = best_of(lambda n: generate_primes(n, workers=args.workers), n_max,
+                               repeat=args.repeat)
+            print(f"{n_max:>12} {serial:>12.4f} {parallel:>14.4f} {serial / parallel:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,7 @@
 import pytest
-
 import numpy as np
 
-@pytest.fixture
 
+@pytest.fixture
 def sample_primes():
-
-return [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
\ No newline at end of file
+    return [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
@@ -0,0 +1,227 @@
+"""Tests for analysis module"""
+
+import pytest
+import numpy as np
+from scipy import signal
+from whitehole.analysis import CMBAnalyzer, GapRangeIndex, PrimeGapAnalyzer, TesseractMapper
+from whitehole.cosmology import CosmicBlinkPattern
+from whitehole.io import CMBDataLoader
+from whitehole.operators import LinguisticOperators
+
+
+@pytest.fixture
+def pattern():
+    return CosmicBlinkPattern(n_primes=50000)
+
+
+def test_gap_range_index_matches_direct(pattern):
+    """Test windowed sum/mean/max/min/entropy against direct NumPy"""
+    gaps = pattern.gaps
+    index = GapRangeIndex(gaps, block_size=16, histogram_block=64)
+    rng = np.random.default_rng(0)
+    i = rng.integers(0, len(gaps) - 1, 300)
+    j = np.minimum(i + rng.integers(1, 400, 300), len(gaps))
+
+    sums, means = index.sum(i, j), index.mean(i, j)
+    maxima, minima = index.max(i, j), index.min(i, j)
+    entropies = index.entropy(i, j)
+    for k, (a, b) in enumerate(zip(i, j)):
+        window = gaps[a:b]
+        probabilities = window / window.sum()
+        assert sums[k] == window.sum()
+        assert np.isclose(means[k], window.mean())
+        assert maxima[k] == window.max()
+        assert minima[k] == window.min()
+        assert np.isclose(entropies[k], -np.sum(probabilities * np.log2(probabilities + 1e-10)))
+
+
+def test_gap_range_index_full_range(pattern):
+    """Test the whole-sequence window reproduces the pattern statistics"""
+    index = GapRangeIndex.from_pattern(pattern)
+    n = len(pattern.gaps)
+    assert index.max(0, n) == pattern.statistics.max
+    assert np.isclose(index.entropy(0, n), pattern.information_content_blink())
+    assert np.allclose(index.sliding(100, step=50, statistic="mean"),
+                       [pattern.gaps[s:s + 100].mean() for s in range(0, n - 99, 50)])
+
+
+def test_gap_range_index_mixed_windows():
+    """Test a batch mixing multi-block windows with one in the last block"""
+    index = GapRangeIndex(np.arange(1, 101), block_size=16)
+    assert np.array_equal(index.max([0, 97, 20], [100, 99, 70]), [100, 99, 70])
+    assert np.array_equal(index.min([0, 97, 20], [100, 99, 70]), [1, 98, 21])
+    assert np.array_equal(index.max([0, 97, 20], [100, 99, 70], chunk_size=2), [100, 99, 70])
+
+
+def test_gap_range_index_rejects_empty_window(pattern):
+    """Test empty or out-of-range windows raise"""
+    index = GapRangeIndex(pattern.gaps)
+    with pytest.raises(ValueError):
+        index.max(5, 5)
+
+
+def test_cmb_modulation_frequency_pairs():
+    """Test batched CMB modulation rows match one call per frequency pair"""
+    analyzer = CMBAnalyzer(CosmicBlinkPattern(n_primes=100))
+    ell, default = analyzer.predicted_cmb_multipole_modulation()
+    expected = np.sin(np.pi * ell / 100) * np.cos(analyzer.pattern.quasiperiodic_modulation(ell / 100))
+    assert np.allclose(default, expected)
+
+    _, rows = analyzer.predicted_cmb_multipole_modulation(phi_1=[1.0, 2.0], dtype=np.float32)
+    assert rows.shape == (2, ell.size) and rows.dtype == np.float32
+    assert np.allclose(rows[1], analyzer.predicted_cmb_multipole_modulation(phi_1=2.0)[1], atol=1e-6)
+
+
+def test_tesseract_vertices_vectorized():
+    """Test the vertex table matches the flat-index digit expansion"""
+    mapper = TesseractMapper(dimension=3, resolution=5)
+    expected = [[i % 5, i // 5 % 5, i // 25] for i in range(125)]
+    assert np.array_equal(mapper.vertices, expected)
+    assert mapper.vertices.dtype == np.uint8
+
+    lazy = TesseractMapper(dimension=4, resolution=300, lazy=True)
+    assert "vertices" not in lazy.__dict__
+    assert lazy.vertex_coordinates(1 + 300 * 299 + 300**3 * 7).tolist() == [1, 299, 0, 7]
+    assert lazy.vertex_coordinates(np.arange(4), axis=0).dtype == np.uint16
+    start, block = next(lazy.iter_vertices(chunk_size=10))
+    assert start == 0 and block.shape == (10, 4)
+
+
+def test_svo_edges_and_adjacency():
+    """Test stride-arithmetic SVO edges match the coordinate definition"""
+    mapper = TesseractMapper(dimension=4, resolution=4)
+    edges = mapper.edge_list_svo_order(chunk_size=50)
+    assert edges.shape == (4**4 * 3, 2)
+    source = mapper.vertices[edges[:, 0]].astype(int)
+    target = mapper.vertices[edges[:, 1]].astype(int)
+    axis = np.tile(np.arange(3), 4**4)
+    expected = source.copy()
+    expected[np.arange(axis.size), axis] = (source[np.arange(axis.size), axis] + 1) % 4
+    assert np.array_equal(target, expected)
+
+    adjacency = mapper.svo_adjacency()
+    assert adjacency.nnz == edges.shape[0]
+    assert np.array_equal(adjacency.nonzero()[1], np.sort(edges.reshape(-1, 3, 2)[:, :, 1], axis=1).ravel())
+    assert (mapper.svo_adjacency(symmetric=True) != mapper.svo_adjacency(symmetric=True).T).nnz == 0
+
+
+def test_vectorized_coloring_matches_per_vertex(pattern):
+    """Test table-lookup coloring matches the per-vertex definitions, singly and stacked"""
+    mapper = TesseractMapper(dimension=4, resolution=5)
+    operator_sets = [LinguisticOperators(2), LinguisticOperators(3)]
+    gap_sets = [pattern.gaps[:100], pattern.gaps[100:130]]
+
+    def svo(ops, vertex):
+        norms = [np.linalg.norm(op) for op in (ops.subject_operator(), ops.verb_operator(), ops.object_operator())]
+        return sum(vertex[d] / mapper.res * norms[d] for d in range(3))
+
+    def resonance(gaps, vertex):
+        phase = vertex[3] / mapper.res * 2 * np.pi
+        return sum(np.cos(phase * g / np.mean(gaps)) for g in gaps[:10]) / 10
+
+    stacked_svo = mapper.color_by_subject_verb_object(operator_sets)
+    stacked_resonance = mapper.color_by_prime_gap_resonance(gap_sets)
+    assert stacked_svo.shape == stacked_resonance.shape == (2, 5**4)
+    for k in range(2):
+        assert np.allclose(stacked_svo[k], [svo(operator_sets[k], v) for v in mapper.vertices])
+        assert np.allclose(stacked_resonance[k], [resonance(gap_sets[k], v) for v in mapper.vertices])
+
+    assert np.array_equal(mapper.color_by_subject_verb_object(operator_sets[0]), stacked_svo[0])
+    lazy = TesseractMapper(dimension=4, resolution=5, lazy=True)
+    assert np.array_equal(lazy.color_by_prime_gap_resonance(gap_sets[1], indices=[7, 300]),
+                          stacked_resonance[1, [7, 300]])
+
+
+def test_stream_colors_to_memmap(tmp_path, pattern):
+    """Test chunked coloring writes the same colors and reduces them exactly"""
+    mapper = TesseractMapper(dimension=4, resolution=6, lazy=True)
+    gap_sets = [pattern.gaps[:50], pattern.gaps[50:90]]
+    result = mapper.stream_colors("prime_gap_resonance", gap_sets, out=tmp_path / "colors.npy",
+                                  chunk_dir=tmp_path, chunk_size=500, bins=8)
+    expected = mapper.color_by_prime_gap_resonance(gap_sets)
+    assert np.array_equal(np.load(tmp_path / "colors.npy"), expected)
+    assert np.array_equal(np.load(tmp_path / "colors_000000000500.npy"), expected[:, 500:1000])
+    assert np.array_equal(result["min"], expected.min(axis=1))
+    assert np.array_equal(result["max"], expected.max(axis=1))
+    for k in range(2):
+        assert np.array_equal(result["histogram"][k], np.histogram(expected[k], bins=8)[0])
+    assert "vertices" not in mapper.__dict__
+
+    custom = mapper.stream_colors(lambda i: i % 4, bins=4, value_range=(0, 4), dtype=np.float32)
+    assert custom["histogram"].tolist() == [324] * 4 and custom["max"] == 3
+
+
+def test_fft_autocorrelation_matches_direct(pattern):
+    """Test FFT and streaming autocorrelations match np.correlate"""
+    gaps = pattern.gaps[:5000]
+    centered = gaps - np.mean(gaps)
+    direct = np.correlate(centered, centered, mode='full')[gaps.size - 1:]
+    direct = direct / direct[0]
+
+    assert np.allclose(PrimeGapAnalyzer.autocorrelation(gaps), direct)
+    assert np.allclose(PrimeGapAnalyzer.autocorrelation(gaps, max_lag=300), direct[:301])
+    single = PrimeGapAnalyzer.autocorrelation(gaps.astype(np.float32), max_lag=300)
+    assert single.dtype == np.float32 and np.allclose(single, direct[:301], atol=1e-5)
+
+    chunks = [gaps[i:i + 333] for i in range(0, gaps.size, 333)]
+    assert np.allclose(PrimeGapAnalyzer.autocorrelation_stream(chunks, max_lag=500), direct[:501])
+    # A lag window longer than the first chunks still pairs values across chunks
+    short = [gaps[:5], gaps[5:12], gaps[12:40]]
+    assert np.allclose(PrimeGapAnalyzer.autocorrelation_stream(short, max_lag=100),
+                       PrimeGapAnalyzer.autocorrelation(gaps[:40]))
+
+
+def test_welch_spectrum_streaming(pattern):
+    """Test streamed Welch spectra and spectrograms match scipy.signal"""
+    gaps = pattern.gaps.astype(float)
+    frequencies, expected = signal.welch(gaps, nperseg=512, noverlap=256)
+
+    chunks = (gaps[i:i + 1000] for i in range(0, gaps.size, 1000))
+    freqs, power = PrimeGapAnalyzer.welch_spectrum(chunks, segment_length=512, overlap=0.5, workers=-1)
+    assert np.allclose(freqs, frequencies)
+    assert np.allclose(power, expected)
+
+    starts, freqs, rows = PrimeGapAnalyzer.spectrogram(gaps, segment_length=255, overlap=0.25)
+    _, centers, reference = signal.spectrogram(gaps, window="hann", nperseg=255, noverlap=64)
+    assert np.allclose(starts + 255 / 2, centers)
+    assert np.allclose(rows, reference.T)
+
+    # Chunks shorter than a segment are carried over until one completes
+    small = [gaps[i:i + 100] for i in range(0, gaps.size, 100)]
+    freqs, power = PrimeGapAnalyzer.welch_spectrum(small, segment_length=512, overlap=0.5)
+    assert np.allclose(power, expected)
+    starts, _, rows = PrimeGapAnalyzer.spectrogram(small, segment_length=255, overlap=0.25)
+    assert np.allclose(rows, reference.T)
+
+    # The full-FFT spectrum keeps its original behaviour
+    assert PrimeGapAnalyzer.gap_spectrum(gaps[:100])[1].size == 100
+
+
+def test_chi_squared_grid_matches_loop():
+    """Test the batched χ² grid matches anomaly_significance per model and spectrum"""
+    analyzer = CMBAnalyzer(CosmicBlinkPattern(n_primes=100))
+    ell, baseline = CMBDataLoader.generate_mock_cmb(301)
+    rng = np.random.default_rng(1)
+    observed = baseline * (1 + 0.05 * rng.standard_normal((4, baseline.size)))
+    phi_1 = np.array([0.5, 1.0, 1.5])[:, None]
+    phi_2 = np.array([0.2, 0.7])[None, :]
+    amplitudes = np.array([0.0, 0.1, 0.3])
+
+    chi = analyzer.chi_squared_grid(observed, baseline, phi_1, phi_2, amplitudes, chunk_size=5)
+    assert chi.shape == (3, 2, 3, 4)
+    for i, j, k, s in np.ndindex(*chi.shape):
+        _, modulation = analyzer.predicted_cmb_multipole_modulation(ell.size + 2, phi_1[i, 0], phi_2[0, j])
+        expected = analyzer.anomaly_significance(observed[s], baseline * (1 + amplitudes[k] * modulation))
+        assert np.isclose(chi[i, j, k, s], expected)
+
+    single = analyzer.chi_squared_grid(observed[0], baseline, [1.0], amplitudes=0.1)
+    assert single.shape == (1, 1)
+    assert analyzer.ell_basis(ell.size + 2) is analyzer.ell_basis(ell.size + 2)
+
+    # At and near the exact fit the residuals are not lost to cancellation
+    _, modulation = analyzer.predicted_cmb_multipole_modulation(ell.size + 2, 1.0, 0.7)
+    model = baseline * (1 + 0.1 * modulation)
+    near = model * (1 + 1e-6 * rng.standard_normal(model.size))
+    chi = analyzer.chi_squared_grid(np.stack((model, near)), baseline, 1.0, 0.7, 0.1)
+    assert chi[0, 0] == 0
+    assert np.isclose(chi[0, 1], analyzer.anomaly_significance(near, model), rtol=1e-10)
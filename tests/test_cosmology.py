@@ -0,0 +1,246 @@
+"""Tests for cosmology module"""
+
+import pytest
+import numpy as np
+from whitehole.cosmology import (
+    generate_primes,
+    prime_gaps,
+    iter_prime_gaps,
+    information_content_stream,
+    CosmicBlinkPattern,
+    _position_scales,
+)
+from whitehole.sieve import prime_count, nth_prime, nth_prime_upper_bound
+
+
+def reference_primes(n_max):
+    """Trial division reference for small bounds"""
+    return [n for n in range(2, n_max + 1) if all(n % d for d in range(2, int(n**0.5) + 1))]
+
+
+def test_generate_primes_small(sample_primes):
+    """Test sieve output matches known primes"""
+    primes = generate_primes(30)
+    assert isinstance(primes, np.ndarray)
+    assert primes.tolist() == sample_primes
+
+
+@pytest.mark.parametrize("n_max", [0, 1, 2, 13, 17, 289, 1000, 5003])
+def test_generate_primes_segment_boundaries(n_max):
+    """Test tiny segments give the same primes as a reference sieve"""
+    assert generate_primes(n_max, segment_size=7).tolist() == reference_primes(n_max)
+
+
+def test_generate_primes_count():
+    """Test π(10^6) across many default-sized segments"""
+    assert len(generate_primes(10**6)) == 78498
+
+
+def test_generate_primes_parallel_matches_serial():
+    """Test segments sieved in a process pool are stitched back in order"""
+    serial = generate_primes(200003, segment_size=1000)
+    parallel = generate_primes(200003, segment_size=1000, workers=3)
+    assert np.array_equal(serial, parallel)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000, 10**6])
+def test_iter_prime_gaps_matches_full_gaps(chunk_size):
+    """Test streamed gaps keep the gap spanning segment and chunk boundaries"""
+    expected = prime_gaps(generate_primes(50000))
+    chunks = list(iter_prime_gaps(chunk_size, stop=50001, segment_size=500))
+    assert all(len(c) == chunk_size for c in chunks[:-1])
+    assert np.array_equal(np.concatenate(chunks), expected)
+
+
+def test_iter_prime_gaps_unbounded():
+    """Test the unbounded stream grows its base primes as it goes"""
+    stream = iter_prime_gaps(chunk_size=5000, segment_size=256)
+    gaps = np.concatenate([next(stream) for _ in range(4)])
+    assert np.array_equal(gaps, prime_gaps(generate_primes(300000))[:20000])
+
+
+def test_information_content_stream_matches_pattern():
+    """Test streaming entropy equals the in-memory blink entropy"""
+    pattern = CosmicBlinkPattern(n_primes=20000)
+    streamed = information_content_stream(iter_prime_gaps(333, stop=int(pattern.primes[-1]) + 1))
+    assert np.isclose(streamed, pattern.information_content_blink())
+
+
+def test_blink_operator_batch_matches_scan():
+    """Test vectorized blink counts against a direct scan"""
+    pattern = CosmicBlinkPattern(n_primes=2000)
+    rng = np.random.default_rng(0)
+    queries = np.concatenate([pattern.blink_times[::7], rng.uniform(0, pattern.blink_times[-1], 50)])
+    tolerance = 0.5 * pattern.t_p
+
+    counts, nearest, distance = pattern.blink_operator(queries, tolerance, return_nearest=True)
+    for q, c, i, d in zip(queries, counts, nearest, distance):
+        offsets = np.abs(pattern.blink_times - q)
+        assert c == np.sum(offsets < tolerance)
+        assert np.isclose(d, offsets.min())
+        assert np.isclose(offsets[i], offsets.min())
+
+
+def test_blink_operator_scalar():
+    """Test scalar queries keep returning plain integers"""
+    pattern = CosmicBlinkPattern(n_primes=100)
+    tolerance = 0.1 * pattern.t_p
+    assert pattern.blink_operator(pattern.blink_times[3], tolerance) == 1
+    assert pattern.blink_operator(-1.0, tolerance) == 0
+    assert isinstance(pattern.blink_operator(0.0), int)
+
+    # A single prime has no gaps and so no blinks
+    empty = CosmicBlinkPattern(n_primes=1)
+    assert empty.blink_operator(0.0) == 0
+    assert np.array_equal(empty.blink_operator(np.zeros(3)), [0, 0, 0])
+    with pytest.raises(ValueError):
+        empty.blink_operator(0.0, return_nearest=True)
+
+
+def test_lazy_pattern_defers_sieving():
+    """Test lazy patterns compute derived arrays only on first access"""
+    lazy = CosmicBlinkPattern(n_primes=5000, lazy=True)
+    assert not {"primes", "gaps", "blink_times"} & set(vars(lazy))
+
+    eager = CosmicBlinkPattern(n_primes=5000)
+    assert np.array_equal(lazy.blink_times, eager.blink_times)
+    assert "primes" not in vars(lazy)
+    assert np.array_equal(lazy.primes, eager.primes)
+    assert lazy.gaps.dtype == np.int16
+
+
+def test_extend_matches_fresh_pattern():
+    """Test extending a pattern equals building it at the larger size"""
+    grown = CosmicBlinkPattern(n_primes=300).extend(20000)
+    fresh = CosmicBlinkPattern(n_primes=len(generate_primes(20000)))
+
+    assert np.array_equal(grown.primes, fresh.primes)
+    assert np.array_equal(grown.gaps, fresh.gaps)
+    assert np.allclose(grown.blink_times, fresh.blink_times, rtol=1e-12, atol=0)
+    assert np.isclose(grown.information_content_blink(), fresh.information_content_blink())
+    assert grown.statistics.max == fresh.gaps.max()
+    assert np.allclose(grown.eigenvalue_bifurcation_sequence(), fresh.eigenvalue_bifurcation_sequence())
+
+
+def test_entropy_matches_direct_formula():
+    """Test histogram entropy equals the per-gap Shannon sum"""
+    pattern = CosmicBlinkPattern(n_primes=10000)
+    probabilities = pattern.gaps / np.sum(pattern.gaps)
+    expected = -np.sum(probabilities * np.log2(probabilities + 1e-10))
+    assert np.isclose(pattern.information_content_blink(), expected)
+
+
+def test_fractal_dimension_modulo_matches_original():
+    """Test the histogram-based estimator reproduces the original loop"""
+    pattern = CosmicBlinkPattern(n_primes=50000)
+    gaps = pattern.gaps.astype(np.int64)
+    scales = np.logspace(0, np.log10(np.max(gaps)), 20)
+    counts = [np.sum((gaps % scale) < scale / 2) for scale in scales]
+    expected = -np.polyfit(np.log10(scales), np.log10(np.array(counts) + 1), 1)[0]
+    assert np.isclose(pattern.fractal_dimension(), expected)
+
+
+@pytest.mark.parametrize("method", ["modulo", "box", "correlation"])
+def test_fractal_dimension_bootstrap_interval(method):
+    """Test bootstrap intervals are reproducible for a fixed seed"""
+    pattern = CosmicBlinkPattern(n_primes=20000)
+    dim, (low, high) = pattern.fractal_dimension(method=method, n_bootstrap=20,
+                                                 random_state=3, workers=2)
+    again = pattern.fractal_dimension(method=method, n_bootstrap=20, random_state=3)
+    assert low <= high
+    assert np.isfinite(dim)
+    assert again == (dim, (low, high))
+
+
+def test_branching_probability_batch_matches_scalar():
+    """Test array queries agree with one-at-a-time calls"""
+    pattern = CosmicBlinkPattern(n_primes=2000)
+    indices = np.array([0, 5, 17, len(pattern.gaps) - 1, len(pattern.gaps), 10**6])
+    expected = [pattern.multiverse_branching_probability(int(i)) for i in indices]
+    assert np.allclose(pattern.multiverse_branching_probability(indices), expected)
+
+
+def test_simulate_branching_mean_growth():
+    """Test mean branch count follows the product of (1 + p_k)"""
+    pattern = CosmicBlinkPattern(n_primes=200)
+    result = pattern.simulate_branching(n_realizations=20000, n_blinks=12, n_lineages=3,
+                                        chunk_size=3000, random_state=7)
+    expected = np.cumprod(1 + pattern.multiverse_branching_probability(np.arange(12)))
+    assert np.allclose(result["mean"], expected, rtol=0.03)
+    assert result["lineage_splits"].shape == (20000, 3)
+    assert result["lineage_splits"].max() <= 12
+
+    again = pattern.simulate_branching(n_realizations=20000, n_blinks=12, n_lineages=3,
+                                       chunk_size=3000, random_state=7)
+    assert np.array_equal(result["final"], again["final"])
+
+
+def test_pattern_uses_exactly_n_primes():
+    """Test n_primes counts primes rather than bounding them"""
+    pattern = CosmicBlinkPattern(n_primes=10000)
+    assert len(pattern.primes) == 10000
+    assert pattern.primes[-1] == 104729
+    assert len(pattern.gaps) == 9999
+
+
+@pytest.mark.parametrize("x, expected", [(1, 0), (2, 1), (100, 25), (10**6, 78498),
+                                         (10**9, 50847534)])
+def test_prime_count(x, expected):
+    """Test π(x) against known values"""
+    assert prime_count(x) == expected
+
+
+def test_nth_prime_upper_bound_holds():
+    """Test the nth-prime bound never undershoots"""
+    primes = generate_primes(nth_prime_upper_bound(50000))
+    n = np.arange(1, 50001)
+    assert np.all([nth_prime_upper_bound(k) >= p for k, p in zip(n[::97], primes[:50000:97])])
+    assert nth_prime(50000) == primes[49999]
+
+
+def test_position_scales_reach_sub_unit_spacings():
+    """Test fractal scales start at the smallest spacing even below 1"""
+    spacings = np.array([0.55, 0.8, 1.3, 0.6] * 50)
+    assert np.isclose(_position_scales(spacings, 8)[0], 0.55)
+    assert _position_scales(np.array([2, 4, 2, 6] * 50), 8)[0] == 2
+
+
+def test_zeta_blink_mode(tmp_path):
+    """Test zeta patterns blink at zero spacings with float statistics"""
+    pattern = CosmicBlinkPattern(n_primes=300, source="zeta")
+    assert pattern.gaps.dtype == np.float64
+    assert pattern.gaps.size == 299
+    assert np.isclose(pattern.gaps[0], 21.022039638771555 - 14.134725141734693)
+    assert np.isclose(pattern.blink_times[-1],
+                      np.sum(pattern.gaps) * pattern.t_p / np.max(pattern.gaps))
+
+    p = pattern.gaps / np.sum(pattern.gaps)
+    assert np.isclose(pattern.information_content_blink(), -np.sum(p * np.log2(p)))
+    assert np.isfinite(pattern.fractal_dimension())
+
+    cached = CosmicBlinkPattern(n_primes=300, source="zeta", zero_cache=tmp_path / "zeros.bin")
+    assert np.allclose(cached.gaps, pattern.gaps)
+    with pytest.raises(ValueError):
+        pattern.extend(1000)
+
+
+def test_quasiperiodic_modulation_chunked(tmp_path):
+    """Test chunked, multi-frequency and out-buffer modulation match direct evaluation"""
+    pattern = CosmicBlinkPattern(n_primes=100)
+    t = np.linspace(0, 50, 10001).reshape(73, 137)
+    golden = (1 + np.sqrt(5)) / 2
+    direct = np.cos(2 * np.pi * t) + np.cos(2 * np.pi * t / golden)
+    assert np.allclose(pattern.quasiperiodic_modulation(t, chunk_size=1000), direct)
+    assert np.isclose(pattern.quasiperiodic_modulation(0.3), np.cos(0.6 * np.pi) + np.cos(0.6 * np.pi / golden))
+
+    phi_1 = np.array([0.5, 1.0, 2.0])
+    phi_2 = np.array([[0.1], [0.3]])
+    out = np.lib.format.open_memmap(tmp_path / "modulation.npy", mode="w+",
+                                    dtype=np.float32, shape=(2, 3) + t.shape)
+    result = pattern.quasiperiodic_modulation(t, phi_1, phi_2, out=out, chunk_size=4096)
+    assert result is out
+    expected = np.cos(2 * np.pi * phi_1[:, None, None] * t) + np.cos(2 * np.pi * 0.3 * t)
+    assert np.allclose(np.load(tmp_path / "modulation.npy")[1], expected, atol=1e-5)
+
+    with pytest.raises(ValueError):
+        pattern.quasiperiodic_modulation(t, out=np.empty(5))
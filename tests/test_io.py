@@ -0,0 +1,77 @@
+"""Tests for io module"""
+
+import os
+import numpy as np
+from whitehole.cosmology import generate_primes, CosmicBlinkPattern
+from whitehole.io import PrimeDatabase, ZetaZeroTable
+from whitehole.zeta import zeta_zeros
+
+
+def test_prime_database_grows_incrementally(tmp_path):
+    """Test the cache extends past its last prime and decodes exactly"""
+    db = PrimeDatabase(tmp_path / "primes.bin")
+    db.extend_to(1000)
+    assert np.array_equal(db.primes(), generate_primes(1000))
+
+    db.extend_to(200000)
+    assert db.last_prime == generate_primes(200000)[-1]
+    assert np.array_equal(db.primes_up_to(150000), generate_primes(150000))
+    assert np.array_equal(db.gaps(5000), np.diff(generate_primes(200000)[:5000]))
+
+
+def test_prime_database_shared_between_instances(tmp_path):
+    """Test a second handle maps the data written by the first"""
+    path = tmp_path / "primes.bin"
+    PrimeDatabase(path).ensure_count(10000)
+    reopened = PrimeDatabase(path)
+    assert len(reopened) >= 10000
+    assert reopened.primes(10000)[-1] == 104729
+    assert isinstance(reopened.half_gaps(), np.memmap)
+
+
+def test_prime_database_escapes_large_gaps(tmp_path):
+    """Test gaps too large for a byte round-trip through the escape table"""
+    db = PrimeDatabase(tmp_path / "primes.bin")
+    db.extend_to(10**6)
+    half = np.asarray(db.half_gaps()).copy()
+    # Pretend one gap overflowed by moving it into the escape table
+    with open(db.escape_path, "ab") as esc:
+        esc.write(np.array([[100, 2 * half[100]]], dtype=np.uint64).tobytes())
+    with open(db.path, "r+b") as f:
+        n_gaps, last_prime, _ = db._read_header()
+        f.write(db.HEADER.pack(db.MAGIC, n_gaps, last_prime, 1))
+        f.seek(db.HEADER.size + 100)
+        f.write(b"\x00")
+    assert np.array_equal(db.primes_up_to(10**6), generate_primes(10**6))
+
+
+def test_prime_database_drops_unpublished_escapes(tmp_path):
+    """Test escape rows left by an interrupted growth are overwritten"""
+    db = PrimeDatabase(tmp_path / "primes.bin")
+    db.extend_to(10**4)
+    # An interrupted growth wrote an escape row but never published it
+    with open(db.escape_path, "ab") as esc:
+        esc.write(np.array([[3, 1000]], dtype=np.uint64).tobytes())
+    db.extend_to(10**5)
+    assert os.path.getsize(db.escape_path) == db.ESCAPE_ROW * db._read_header()[2]
+    assert np.array_equal(db.primes_up_to(10**5), generate_primes(10**5))
+
+
+def test_blink_pattern_from_cache(tmp_path):
+    """Test patterns built from the cache match freshly sieved ones"""
+    cached = CosmicBlinkPattern(n_primes=5000, prime_cache=tmp_path / "primes.bin")
+    fresh = CosmicBlinkPattern(n_primes=5000)
+    assert np.array_equal(cached.primes, fresh.primes)
+    assert np.allclose(cached.blink_times, fresh.blink_times)
+
+
+def test_zeta_zero_table_grows_incrementally(tmp_path):
+    """Test the zero table appends past its last zero and persists"""
+    path = tmp_path / "zeros.bin"
+    table = ZetaZeroTable(path)
+    first = np.array(table.zeros(200))
+    table.ensure_count(500)
+    reopened = ZetaZeroTable(path)
+    assert len(reopened) == 500
+    assert np.array_equal(reopened.zeros(200), first)
+    assert np.allclose(reopened.zeros(), zeta_zeros(500), rtol=0, atol=1e-10)
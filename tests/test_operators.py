@@ -0,0 +1,183 @@
+"""Tests for operators module"""
+
+import pytest
+import numpy as np
+from scipy.linalg import expm
+from whitehole.operators import LinguisticChain, LinguisticOperators, SpectralPropagator
+
+
+def stepped_states(ops, state, steps, dt, coupling=1.0):
+    """Reference evolution with one expm per step"""
+    H = ops.linguistic_hamiltonian(coupling)
+    states = [state]
+    for _ in range(steps):
+        states.append(expm(-1j * H * dt) @ states[-1])
+    return np.array(states)
+
+
+def test_sequence_uses_cached_propagator():
+    """Test the preallocated trajectory matches per-step expm and reuses U"""
+    ops = LinguisticOperators(2)
+    state = np.array([1, 0, 0, 0], dtype=complex)
+    states = ops.subject_verb_object_sequence(state, 50, dt=0.02, coupling_strength=0.5)
+    assert states.shape == (51, 4)
+    assert np.allclose(states, stepped_states(ops, state, 50, 0.02, 0.5))
+    assert ops.propagator(0.5, 0.02) is ops.propagator(0.5, 0.02)
+
+    thinned = ops.subject_verb_object_sequence(state, 50, dt=0.02, coupling_strength=0.5, keep_every=10)
+    assert np.allclose(thinned, states[::10])
+    assert np.allclose(np.linalg.norm(thinned, axis=1), 1)
+    with pytest.raises(ValueError):
+        ops.subject_verb_object_sequence(state, 55, dt=0.02, keep_every=10)
+
+
+def test_evolve_batch_matches_single_runs():
+    """Test batched evolution over states and couplings matches individual runs"""
+    ops = LinguisticOperators(2)
+    rng = np.random.default_rng(0)
+    states = rng.standard_normal((5, 4)) + 1j * rng.standard_normal((5, 4))
+    states /= np.linalg.norm(states, axis=1, keepdims=True)
+    couplings = np.array([0.3, 1.0, 2.5])
+
+    batch = ops.evolve_batch(states, 40, dt=0.05, couplings=couplings, keep_every=4)
+    assert batch.shape == (3, 5, 11, 4)
+    for c, g in enumerate(couplings):
+        for s in range(5):
+            single = ops.subject_verb_object_sequence(states[s], 40, dt=0.05, coupling_strength=g, keep_every=4)
+            assert np.allclose(batch[c, s], single)
+
+    populations = ops.evolve_batch(states, 40, dt=0.05, couplings=couplings,
+                                   reducer=lambda block: np.mean(np.abs(block)**2, axis=1))
+    assert populations.shape == (41, 3, 4)
+    assert np.allclose(populations[::4], np.mean(np.abs(batch)**2, axis=1).transpose(1, 0, 2))
+    with pytest.raises(ValueError):
+        ops.evolve_batch(states, 42, dt=0.05, couplings=couplings, keep_every=4)
+
+
+@pytest.mark.parametrize("dimension", [2, 4])
+def test_spectral_evolution_matches_expm(dimension):
+    """Test spectral states, expectations and survival at arbitrary times"""
+    ops = LinguisticOperators(dimension)
+    size = ops.linguistic_hamiltonian().shape[0]
+    rng = np.random.default_rng(dimension)
+    states = rng.standard_normal((3, size)) + 1j * rng.standard_normal((3, size))
+    times = np.array([2.5, 0.0, 0.013, 7.0])
+    H = ops.linguistic_hamiltonian(0.8)
+    expected = np.array([[expm(-1j * H * t) @ psi for psi in states] for t in times])
+
+    evolved = ops.evolve_spectral(states, times, coupling_strength=0.8)
+    assert np.allclose(evolved, expected)
+    assert ops.spectral_propagator.hermitian == (dimension == 2)
+
+    values = ops.expectation_values(states, times, coupling_strength=0.8)
+    O = ops.lifted_operator("O")
+    assert np.allclose(values["O"], np.einsum('tsi,ij,tsj->ts', expected.conj(), O, expected).real)
+    survival = ops.survival_probability(states[0], times, coupling_strength=0.8)
+    assert np.allclose(survival, np.abs(expected[:, 0] @ states[0].conj())**2)
+
+    # Sparse mode shares the spectral API, with sparse and matrix-free observables
+    sparse_values = LinguisticOperators(dimension, sparse=True).expectation_values(
+        states, times, coupling_strength=0.8)
+    for name, value in values.items():
+        assert np.allclose(sparse_values[name], value)
+
+
+def test_spectral_propagator_schur_fallback():
+    """Test a defective Hamiltonian is propagated through its Schur form"""
+    H = np.array([[1.0, 1.0], [0.0, 1.0]])
+    propagator = SpectralPropagator(H)
+    assert propagator.schur is not None
+    states = propagator.evolve([1.0, 1.0], [0.5, 3.0])
+    assert np.allclose(states, [expm(-1j * H * t) @ [1.0, 1.0] for t in (0.5, 3.0)])
+
+
+@pytest.mark.parametrize("dimension", [2, 6])
+def test_sparse_mode_matches_dense(dimension):
+    """Test sparse operators, Krylov evolution and sparse norms match the dense path"""
+    dense = LinguisticOperators(dimension)
+    sparse = LinguisticOperators(dimension, sparse=True)
+    for name in ("subject_operator", "verb_operator", "object_operator", "linguistic_hamiltonian"):
+        assert np.allclose(getattr(sparse, name)().toarray(), getattr(dense, name)())
+
+    x = np.random.default_rng(2).standard_normal((dimension, 3))
+    assert np.allclose(sparse.measurement_eye_operator() @ x, dense.measurement_eye_operator() @ x)
+    expected = dense.verify_linguistic_structure()
+    assert all(np.isclose(value, expected[key]) for key, value in sparse.verify_linguistic_structure().items())
+
+    size = dense.linguistic_hamiltonian().shape[0]
+    state = np.ones(size, dtype=complex) / np.sqrt(size)
+    assert np.allclose(sparse.subject_verb_object_sequence(state, 40, dt=0.05, keep_every=4),
+                       dense.subject_verb_object_sequence(state, 40, dt=0.05, keep_every=4))
+    states = np.eye(size, dtype=complex)[:2]
+    assert np.allclose(sparse.evolve_batch(states, 10, couplings=[0.5, 2.0]),
+                       dense.evolve_batch(states, 10, couplings=[0.5, 2.0]))
+    populations = sparse.evolve_batch(states, 12, couplings=[0.5, 2.0], keep_every=3,
+                                      reducer=lambda block: np.abs(block)**2)
+    assert np.allclose(populations, np.abs(dense.evolve_batch(states, 12, couplings=[0.5, 2.0],
+                                                              keep_every=3)).transpose(2, 0, 1, 3)**2)
+
+
+def test_sparse_mode_large_dimension():
+    """Test sparse operators stay linear in size for a large Hilbert space"""
+    ops = LinguisticOperators(200000, sparse=True)
+    assert ops.linguistic_hamiltonian().nnz == 2 * 200000
+    assert np.isclose(ops.verify_linguistic_structure()["S_norm"], np.sqrt(200000))
+    state = np.zeros(200000, dtype=complex)
+    state[0] = 1
+    trajectory = ops.subject_verb_object_sequence(state, 4, dt=0.01, keep_every=2)
+    assert trajectory.shape == (3, 200000)
+
+
+def dense_chain(n_sites, dimension, coupling, periodic):
+    """Reference chain Hamiltonian from explicit Kronecker products"""
+    ops = LinguisticOperators(dimension)
+    S, V, O = ops.subject_operator(), ops.verb_operator(), ops.object_operator()
+
+    def on_site(op, site):
+        factors = [op if i == site else np.eye(dimension) for i in range(n_sites)]
+        result = np.array([[1.0]])
+        for factor in factors:
+            result = np.kron(result, factor)
+        return result
+
+    n_bonds = n_sites if periodic and n_sites > 2 else n_sites - 1
+    H = np.zeros((dimension**n_sites,) * 2, dtype=complex)
+    for j in range(n_bonds):
+        k = (j + 1) % n_sites
+        term = on_site(S, j) @ on_site(V, k) + on_site(V, j) @ on_site(O, k)
+        H += coupling * (term + term.conj().T)
+    return H
+
+
+@pytest.mark.parametrize("n_sites, dimension, periodic", [(4, 2, False), (5, 2, True), (3, 3, True)])
+def test_chain_hamiltonian_matches_kron(n_sites, dimension, periodic):
+    """Test COO assembly and the matrix-free operator match dense Kronecker products"""
+    chain = LinguisticOperators(dimension).chain(n_sites, coupling_strength=0.7, periodic=periodic)
+    expected = dense_chain(n_sites, dimension, 0.7, periodic)
+    assert np.allclose(chain.hamiltonian(chunk_size=7).toarray(), expected)
+
+    x = np.random.default_rng(3).standard_normal((chain.size, 2))
+    assert np.allclose(chain.linear_operator() @ x, expected @ x)
+    assert np.allclose(chain.linear_operator() @ x[:, 0], expected @ x[:, 0])
+
+    z = x[:, 0] + 1j * x[:, 1]
+    adjoint = expected.conj().T
+    assert np.allclose(chain.linear_operator().rmatvec(z), adjoint @ z)
+    assert np.allclose(chain.linear_operator().H @ x, adjoint @ x)
+
+
+def test_chain_momentum_sectors_cover_spectrum():
+    """Test momentum blocks are Hermitian and together reproduce the full spectrum"""
+    chain = LinguisticChain(6, periodic=True)
+    blocks = [chain.momentum_sector(m)[0].toarray() for m in range(6)]
+    assert all(np.allclose(block, block.conj().T) for block in blocks)
+    assert sum(block.shape[0] for block in blocks) == 2**6
+    spectrum = np.sort(np.concatenate([np.linalg.eigvalsh(block) for block in blocks]))
+    assert np.allclose(spectrum, np.linalg.eigvalsh(chain.hamiltonian().toarray()))
+
+    # Walking the basis in small chunks gives the same orbits and sectors
+    chunked = LinguisticChain(6, periodic=True, chunk_size=5)
+    for a, b in zip(chunked.translation_orbits, chain.translation_orbits):
+        assert np.array_equal(a, b)
+    assert np.allclose(chunked.momentum_sector(2)[0].toarray(), blocks[2])
+    assert np.allclose(LinguisticChain(2).hamiltonian().toarray(), LinguisticOperators(2).linguistic_hamiltonian())
@@ -0,0 +1,30 @@
+"""Tests for zeta module"""
+
+import numpy as np
+from whitehole.zeta import gram_points, riemann_siegel_theta, siegel_z, zeta_zeros
+
+FIRST_ZEROS = [14.134725141734693, 21.022039638771555, 25.010857580145688,
+               30.424876125859513, 32.93506158773919, 37.58617815882567]
+
+
+def test_first_zeros():
+    """Test the batch search reproduces the known first zeros"""
+    assert np.allclose(zeta_zeros(6), FIRST_ZEROS, rtol=0, atol=1e-12)
+    assert np.all(np.abs(siegel_z(FIRST_ZEROS)) < 1e-10)
+
+
+def test_zeros_resume_after_height():
+    """Test a search started above a zero continues the same sequence"""
+    zeros = zeta_zeros(1500)
+    assert np.all(np.diff(zeros) > 0)
+    # Crosses the switch from Euler-Maclaurin to Riemann-Siegel near t = 1000
+    assert np.allclose(zeta_zeros(100, after=zeros[1199]), zeros[1200:1300], rtol=0, atol=1e-9)
+    # The 1000th zero is known to many digits
+    assert abs(zeros[999] - 1419.4224809459956) < 1e-9
+
+
+def test_gram_points():
+    """Test Gram points solve theta(g_m) = m pi"""
+    m = np.array([-1, 0, 1, 100, 10**5])
+    assert np.allclose(riemann_siegel_theta(gram_points(m)), m * np.pi, rtol=0, atol=1e-9)
+    assert abs(gram_points(0) - 17.845599542) < 1e-8
@@ -1,51 +1,31 @@
 """
-
 WhiteHole: A Unified Model of Black Holes, White Holes, and Cosmic Blinking
 
 This package formalizes the theoretical framework connecting:
-
 - Black/White hole superposition and quantum transitions
-
 - Linguistic-semantic operators (Subject, Verb, Object)
-
 - Prime gap modulation of cosmic rhythms
-
 - Universe blinking patterns and information flow
-
 - Tesseract-based multidimensional mappings
 
 Author: Lovely Rhythm Melody
-
 Date: October 2025
-
 """
 
 __version__ = "0.1.0"
-
 __author__ = "Lovely Rhythm Melody"
 
 from .core import *
-
 from .operators import *
-
 from .cosmology import *
-
 from .analysis import *
 
 __all__ = [
-
-"BlackWhiteHoleSystem",
-
-"SuperpositionState",
-
-"LinguisticOperators",
-
-"CosmicBlinkPattern",
-
-"TesseractMapper",
-
-"PrimeGapAnalyzer",
-
-"CMBAnalyzer"
-
-]
\ No newline at end of file
+    "BlackWhiteHoleSystem",
+    "SuperpositionState",
+    "LinguisticOperators",
+    "CosmicBlinkPattern",
+    "TesseractMapper",
+    "PrimeGapAnalyzer",
+    "CMBAnalyzer"
+]
@@ -1,221 +1,910 @@
 """
-
 Analysis tools for CMB signatures, tesseract mappings, and pattern detection
-
 """
 
-import numpy as np
-
-from scipy.fft import fft, fftfreq
-
-class PrimeGapAnalyzer:
-
-"""Analyze patterns in prime gaps and their signatures"""
-
-@staticmethod
-
-def gap_spectrum(gaps):
-
-"""Compute Fourier spectrum of gap sequence"""
-
-gap_fft = fft(gaps)
-
-frequencies = fftfreq(len(gaps))
-
-power = np.abs(gap_fft)**2
-
-return frequencies, power
-
-@staticmethod
+import os
+from functools import cached_property
 
-def autocorrelation(gaps):
-
-"""Compute autocorrelation of gap sequence"""
-
-gaps_mean = gaps - np.mean(gaps)
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.fft import fft, fftfreq, irfft, next_fast_len, rfft, rfftfreq
+from scipy.signal import get_window
+from scipy.sparse import csr_matrix
 
-autocorr = np.correlate(gaps_mean, gaps_mean, mode='full')
+from .operators import operator_norm
+from .sieve import resolve_workers
 
-autocorr = autocorr[len(autocorr)//2:]
 
-autocorr = autocorr / autocorr[0]
+class PrimeGapAnalyzer:
+    """Analyze patterns in prime gaps and their signatures"""
+
+    @staticmethod
+    def gap_spectrum(gaps):
+        """Compute Fourier spectrum of gap sequence"""
+        gap_fft = fft(gaps)
+        frequencies = fftfreq(len(gaps))
+        power = np.abs(gap_fft)**2
+
+        return frequencies, power
+
+    @staticmethod
+    def welch_spectrum(gap_chunks, segment_length=4096, overlap=0.5, window="hann",
+                       workers=None, dtype=np.float64):
+        """
+        Welch-averaged one-sided power spectral density of a gap sequence
+
+        Args:
+            gap_chunks: Gap array, or an iterable of gap chunks streamed in order
+            segment_length: Gaps per FFT segment
+            overlap: Fraction of a segment shared with the next one
+            window: Window name or tuple understood by scipy.signal.get_window
+            workers: Threads per FFT (-1 for all cores)
+            dtype: float32 or float64 FFT precision
+
+        Returns:
+            frequencies, power (cycles per gap, density with unit sampling)
+        """
+        estimator = StreamingWelch(segment_length, overlap, window, workers, dtype)
+        for chunk in _as_chunks(gap_chunks):
+            estimator.update(chunk)
+        return estimator.result()
+
+    @staticmethod
+    def spectrogram(gap_chunks, segment_length=4096, overlap=0.5, window="hann",
+                    workers=None, dtype=np.float64):
+        """
+        Per-segment power spectral densities of a gap sequence
+
+        Returns:
+            segment_starts, frequencies, power of shape (n_segments, n_frequencies)
+        """
+        estimator = StreamingWelch(segment_length, overlap, window, workers, dtype)
+        starts, rows = [], []
+        for segment_starts, power in estimator.iter_segments(_as_chunks(gap_chunks)):
+            starts.append(segment_starts)
+            rows.append(power)
+        if not rows:
+            return np.empty(0, dtype=np.int64), estimator.frequencies, np.empty((0, estimator.frequencies.size))
+        return np.concatenate(starts), estimator.frequencies, np.concatenate(rows)
+
+    @staticmethod
+    def autocorrelation(gaps, max_lag=None, dtype=None):
+        """
+        Compute autocorrelation of gap sequence
+
+        Uses the FFT of the mean-removed sequence, zero-padded to a fast
+        length of at least n + max_lag so no lag wraps around.
+
+        Args:
+            gaps: Gap sequence
+            max_lag: Largest lag returned (default: all n - 1 lags)
+            dtype: float32 or float64 (default: float32 for float32 input)
+
+        Returns:
+            Autocorrelation for lags 0..max_lag, normalized to 1 at lag 0
+        """
+        gaps = np.asarray(gaps)
+        if dtype is None:
+            dtype = np.float32 if gaps.dtype == np.float32 else np.float64
+        n = gaps.size
+        max_lag = n - 1 if max_lag is None else min(int(max_lag), n - 1)
+
+        gaps_mean = gaps.astype(dtype) - np.mean(gaps, dtype=np.float64).astype(dtype)
+        length = next_fast_len(n + max_lag, real=True)
+        spectrum = rfft(gaps_mean, length)
+        autocorr = irfft(spectrum.real**2 + spectrum.imag**2, length)[:max_lag + 1]
+        autocorr = autocorr / autocorr[0]
+
+        return autocorr
+
+    @staticmethod
+    def autocorrelation_stream(gap_chunks, max_lag, dtype=np.float64):
+        """Autocorrelation up to max_lag of a gap stream in O(max_lag) memory"""
+        accumulator = StreamingAutocorrelation(max_lag, dtype)
+        for chunk in gap_chunks:
+            accumulator.update(chunk)
+        return accumulator.result()
+
+
+def _as_chunks(gap_chunks):
+    """Treat a single array as a one-chunk stream"""
+    if isinstance(gap_chunks, np.ndarray):
+        return (gap_chunks,)
+    return gap_chunks
+
+
+class StreamingWelch:
+    """
+    Welch spectral estimate updated as gap chunks stream in
+
+    Samples that do not yet complete a segment are carried over to the next
+    chunk, so the result equals a Welch estimate of the concatenated stream.
+    Segments are detrended by their mean, windowed and transformed with real
+    FFTs in batches, and their one-sided densities are summed into a running
+    average.
+
+    Args:
+        segment_length: Gaps per FFT segment
+        overlap: Fraction of a segment shared with the next one
+        window: Window name or tuple understood by scipy.signal.get_window
+        workers: Threads per FFT (-1 for all cores)
+        dtype: float32 or float64 FFT precision
+        batch_segments: Segments transformed per FFT call
+    """
+
+    def __init__(self, segment_length=4096, overlap=0.5, window="hann", workers=None,
+                 dtype=np.float64, batch_segments=256):
+        self.segment_length = int(segment_length)
+        self.step = self.segment_length - int(round(overlap * self.segment_length))
+        if not 0 < self.step <= self.segment_length:
+            raise ValueError("overlap must be in [0, 1)")
+        self.dtype = np.dtype(dtype)
+        self.workers = resolve_workers(workers)
+        self.batch_segments = int(batch_segments)
+
+        taper = get_window(window, self.segment_length)
+        self.window = taper.astype(self.dtype)
+        self.scale = 1 / np.sum(taper**2)
+        self.frequencies = rfftfreq(self.segment_length)
+
+        self.power_sum = np.zeros(self.frequencies.size)
+        self.n_segments = 0
+        self.consumed = 0  # stream index of buffer[0]
+        self.buffer = np.empty(0, dtype=self.dtype)
+
+    def _density(self, segments):
+        segments = segments - segments.mean(axis=1, keepdims=True)
+        spectrum = rfft(segments * self.window, axis=1, workers=self.workers)
+        power = (spectrum.real**2 + spectrum.imag**2).astype(np.float64) * self.scale
+        # One-sided: fold negative frequencies into all bins but DC and Nyquist
+        power[:, 1:(self.segment_length + 1) // 2] *= 2
+        return power
+
+    def _consume(self, gaps):
+        """Yield (segment_starts, density) for the segments this chunk completes"""
+        buffer = np.concatenate((self.buffer, np.asarray(gaps, dtype=self.dtype)))
+        if buffer.size < self.segment_length:
+            self.buffer = buffer
+            return
+        n_new = (buffer.size - self.segment_length) // self.step + 1
+        windows = sliding_window_view(buffer, self.segment_length)[::self.step][:n_new]
+
+        for first in range(0, n_new, self.batch_segments):
+            power = self._density(windows[first:first + self.batch_segments])
+            self.power_sum += power.sum(axis=0)
+            self.n_segments += power.shape[0]
+            starts = self.consumed + self.step * np.arange(first, first + power.shape[0])
+            yield starts, power
+
+        self.buffer = buffer[n_new * self.step:].copy()
+        self.consumed += n_new * self.step
+
+    def update(self, gaps):
+        """Fold the next chunk of gaps into the running average"""
+        for _ in self._consume(gaps):
+            pass
+        return self
+
+    def iter_segments(self, gap_chunks):
+        """Stream gap chunks, yielding each batch of segment densities as it is ready"""
+        for chunk in gap_chunks:
+            yield from self._consume(chunk)
+
+    def result(self):
+        """frequencies, Welch-averaged power over every completed segment"""
+        if self.n_segments == 0:
+            raise ValueError("No complete segment has been seen yet")
+        return self.frequencies, self.power_sum / self.n_segments
+
+
+class StreamingAutocorrelation:
+    """
+    Overlap-save autocorrelation of a sequence arriving in chunks
+
+    Each chunk is correlated by FFT against itself and the last max_lag
+    values before it, so every pair (i, i + k) with k <= max_lag is counted
+    exactly once. Raw lagged products are accumulated in float64 around a
+    shift taken from the first chunk; the mean is removed exactly at the
+    end from the totals and the sums of the first and last k values.
+
+    Args:
+        max_lag: Largest lag tracked
+        dtype: Precision of the per-chunk FFTs
+    """
+
+    def __init__(self, max_lag, dtype=np.float64):
+        self.max_lag = int(max_lag)
+        self.dtype = np.dtype(dtype)
+        self.count = 0
+        self.total = 0.0
+        self.shift = None
+        self.products = np.zeros(self.max_lag + 1)
+        self.head = np.empty(0)
+        self.tail = np.empty(0)
+
+    def update(self, gaps):
+        """Fold the next chunk of the sequence into the lagged products"""
+        gaps = np.asarray(gaps)
+        if gaps.size == 0:
+            return self
+        if self.shift is None:
+            self.shift = float(np.mean(gaps, dtype=np.float64))
+
+        chunk = gaps.astype(np.float64) - self.shift
+        block = np.concatenate((self.tail, chunk))
+        later = np.concatenate((np.zeros(self.tail.size), chunk))
+
+        # products[k] += sum_p block[p] * later[p + k]: later element in this chunk
+        length = next_fast_len(block.size + self.max_lag, real=True)
+        cross = irfft(np.conj(rfft(block.astype(self.dtype), length)) * rfft(later.astype(self.dtype), length),
+                      length)
+        self.products += cross[:self.max_lag + 1]
+
+        self.count += chunk.size
+        self.total += float(np.sum(chunk))
+        if self.head.size < self.max_lag:
+            self.head = np.concatenate((self.head, chunk[:self.max_lag - self.head.size]))
+        self.tail = block[-self.max_lag:] if self.max_lag else np.empty(0)
+        return self
+
+    def result(self):
+        """Mean-corrected autocorrelation for lags 0..min(max_lag, n - 1)"""
+        n_lags = min(self.max_lag, self.count - 1) + 1
+        k = np.arange(n_lags)
+        mean = self.total / self.count
+
+        head_sums = np.concatenate(([0.0], np.cumsum(self.head)))[:n_lags]
+        tail_sums = np.concatenate(([0.0], np.cumsum(self.tail[::-1])))[:n_lags]
+        # sum over i < n - k of x_i is total - (last k); over i >= k it is total - (first k)
+        earlier = self.total - tail_sums
+        later = self.total - head_sums
+        covariance = self.products[:n_lags] - mean * (earlier + later) + (self.count - k) * mean**2
+
+        return covariance / covariance[0]
+
+
+def _extreme_fill(dtype, ufunc):
+    """Identity element of np.maximum / np.minimum for a dtype"""
+    limits = np.iinfo(dtype) if np.issubdtype(dtype, np.integer) else np.finfo(dtype)
+    return limits.min if ufunc is np.maximum else limits.max
+
+
+class GapRangeIndex:
+    """
+    Range-query index over a gap sequence for windows [i, j)
+
+    Prefix sums answer sums and means in O(1). Maxima and minima combine
+    in-block prefix/suffix extremes with a sparse table over block extremes,
+    so windows crossing a block boundary cost O(1) and shorter ones at most
+    one block. Cumulative per-block histograms of the gap values give the
+    window entropy in O(distinct gaps + histogram block).
+
+    Args:
+        gaps: Gap sequence, e.g. CosmicBlinkPattern.gaps
+        block_size: Block length for the max/min structure
+        histogram_block: Block length between cumulative histograms
+    """
+
+    def __init__(self, gaps, block_size=64, histogram_block=1024):
+        self.gaps = np.asarray(gaps)
+        self.n = self.gaps.size
+        self.block_size = int(block_size)
+        self.histogram_block = int(histogram_block)
+        self.prefix = np.concatenate(([0], np.cumsum(self.gaps)))
+
+        self._max = self._build_extremes(np.maximum)
+        self._min = self._build_extremes(np.minimum)
+
+    @classmethod
+    def from_pattern(cls, pattern, **kwargs):
+        """Index the gaps of a CosmicBlinkPattern"""
+        return cls(pattern.gaps, **kwargs)
+
+    def _build_extremes(self, ufunc):
+        """In-block prefix/suffix extremes and a sparse table over blocks"""
+        B = self.block_size
+        n_blocks = -(-self.n // B)
+        blocks = np.pad(self.gaps, (0, n_blocks * B - self.n), mode='edge').reshape(n_blocks, B)
+
+        prefix = ufunc.accumulate(blocks, axis=1).ravel()
+        suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+        # table[k, b] = extreme of blocks b .. b + 2^k - 1
+        levels = [ufunc.reduce(blocks, axis=1)]
+        while 2 ** len(levels) <= n_blocks:
+            half = 2 ** (len(levels) - 1)
+            previous = levels[-1]
+            level = previous.copy()
+            level[:-half] = ufunc(previous[:-half], previous[half:])
+            levels.append(level)
+
+        return ufunc, prefix, suffix, np.stack(levels)
+
+    def _bounds(self, i, j):
+        i = np.asarray(i, dtype=np.int64)
+        j = np.asarray(j, dtype=np.int64)
+        if np.any(i < 0) or np.any(j > self.n) or np.any(i >= j):
+            raise ValueError("Windows must satisfy 0 <= i < j <= len(gaps)")
+        return np.broadcast_arrays(i, j)
+
+    def _extreme(self, structure, i, j, chunk_size):
+        ufunc, prefix, suffix, table = structure
+        i, j = self._bounds(i, j)
+        B = self.block_size
+        fill = _extreme_fill(self.gaps.dtype, ufunc)
+        offsets = np.arange(B)
+
+        flat_i = i.ravel()
+        flat_j = j.ravel()
+        result = np.empty(flat_i.size, dtype=self.gaps.dtype)
+
+        for start in range(0, flat_i.size, chunk_size):
+            qi = flat_i[start:start + chunk_size]
+            last = flat_j[start:start + chunk_size] - 1
+            first_block = qi // B
+            last_block = last // B
+            extremes = ufunc(suffix[qi], prefix[last])
+
+            # Whole blocks strictly between the two partial ones; only these
+            # windows index the table, lo may be past the last block otherwise
+            inner = last_block - first_block > 1
+            if np.any(inner):
+                lo, hi = first_block[inner] + 1, last_block[inner]
+                k = np.floor(np.log2(hi - lo)).astype(np.int64)
+                span = ufunc(table[k, lo], table[k, hi - 2 ** k])
+                extremes[inner] = ufunc(extremes[inner], span)
+
+            # Windows inside a single block are reduced directly (at most B values)
+            same = first_block == last_block
+            if np.any(same):
+                positions = qi[same][:, None] + offsets
+                valid = positions <= last[same][:, None]
+                values = self.gaps[np.minimum(positions, self.n - 1)]
+                extremes[same] = ufunc.reduce(np.where(valid, values, fill), axis=1)
+
+            result[start:start + chunk_size] = extremes
+
+        return result.reshape(i.shape)[()]
+
+    def sum(self, i, j):
+        """Sum of gaps[i:j]"""
+        i, j = self._bounds(i, j)
+        return (self.prefix[j] - self.prefix[i])[()]
+
+    def mean(self, i, j):
+        """Mean of gaps[i:j]"""
+        i, j = self._bounds(i, j)
+        return ((self.prefix[j] - self.prefix[i]) / (j - i))[()]
+
+    def max(self, i, j, chunk_size=1 << 14):
+        """Largest gap in gaps[i:j], chunked over queries like entropy"""
+        return self._extreme(self._max, i, j, chunk_size)
+
+    def min(self, i, j, chunk_size=1 << 14):
+        """Smallest gap in gaps[i:j], chunked over queries like entropy"""
+        return self._extreme(self._min, i, j, chunk_size)
+
+    @cached_property
+    def _histograms(self):
+        """Distinct gap values, per-gap value codes and cumulative block counts"""
+        values, codes = np.unique(self.gaps, return_inverse=True)
+        H = self.histogram_block
+        n_blocks = self.n // H
+        count_dtype = np.int32 if self.n < 2**31 else np.int64
+
+        cumulative = np.zeros((n_blocks + 1, values.size), dtype=count_dtype)
+        for b in range(n_blocks):
+            block_counts = np.bincount(codes[b * H:(b + 1) * H], minlength=values.size)
+            cumulative[b + 1] = cumulative[b] + block_counts
+
+        return values, codes.ravel(), cumulative
+
+    def entropy(self, i, j, chunk_size=4096):
+        """
+        Blink entropy of gaps[i:j], as in information_content_blink
+
+        Queries are processed in chunks to bound the temporary count matrix.
+        """
+        i, j = self._bounds(i, j)
+        values, codes, cumulative = self._histograms
+        H = self.histogram_block
+        n_values = values.size
+
+        flat_i = i.ravel()
+        flat_j = j.ravel()
+        entropies = np.empty(flat_i.size)
+        offsets = np.arange(H)
+
+        for start in range(0, flat_i.size, chunk_size):
+            qi = flat_i[start:start + chunk_size]
+            qj = flat_j[start:start + chunk_size]
+            rows = np.arange(qi.size)
+
+            # Whole histogram blocks come from the cumulative table
+            lo_block = -(-qi // H)
+            hi_block = qj // H
+            whole = lo_block <= hi_block
+            counts = np.zeros((qi.size, n_values), dtype=np.int64)
+            counts[whole] = cumulative[hi_block[whole]] - cumulative[lo_block[whole]]
+
+            # Partial blocks at either edge are counted directly
+            left_end = np.minimum(qj, lo_block * H)
+            right_start = np.maximum(hi_block * H, left_end)
+            for edge_start, edge_end in ((qi, left_end), (right_start, qj)):
+                positions = edge_start[:, None] + offsets
+                valid = positions < edge_end[:, None]
+                flat = rows[:, None] * n_values + codes[np.minimum(positions, self.n - 1)]
+                counts += np.bincount(flat[valid], minlength=qi.size * n_values).reshape(qi.size, n_values)
+
+            totals = self.prefix[qj] - self.prefix[qi]
+            probabilities = values[None, :] / totals[:, None]
+            terms = counts * probabilities * np.log2(probabilities + 1e-10)
+            entropies[start:start + chunk_size] = -np.sum(terms, axis=1)
+
+        return entropies.reshape(i.shape)[()]
+
+    def sliding(self, window, step=1, statistic="mean"):
+        """
+        Evaluate a statistic over every window of the given length
+
+        Args:
+            window: Window length in gaps
+            step: Offset between consecutive window starts
+            statistic: One of "sum", "mean", "max", "min", "entropy"
+
+        Returns:
+            Array with one value per window start
+        """
+        starts = np.arange(0, self.n - window + 1, step)
+        return getattr(self, statistic)(starts, starts + window)
 
-return autocorr
 
 class CMBAnalyzer:
+    """Analyze cosmic microwave background for blink signatures"""
+
+    def __init__(self, blink_pattern):
+        """Initialize with cosmic blink pattern"""
+        self.pattern = blink_pattern
+        self._ell_bases = {}
+
+    def ell_basis(self, ell_max=100):
+        """
+        Cached multipole basis for ℓ = 2 .. ell_max - 1
+
+        Returns:
+            (ell, ell / 100, sin(π ℓ / 100)) as read-only arrays
+        """
+        basis = self._ell_bases.get(ell_max)
+        if basis is None:
+            ell = np.arange(2, ell_max)
+            basis = (ell, ell / 100.0, np.sin(np.pi * ell / 100.0))
+            for array in basis:
+                array.flags.writeable = False
+            self._ell_bases[ell_max] = basis
+        return basis
+
+    def predicted_cmb_multipole_modulation(self, ell_max=100, phi_1=None, phi_2=None, dtype=None):
+        """
+        Predict how blink pattern modulates CMB power spectrum
+        at different multipole moments ℓ
+
+        Frequency arrays give one modulation row per (phi_1, phi_2) pair,
+        all evaluated in a single pass over ℓ and transformed in place.
+        """
+        ell_array, grid, envelope = self.ell_basis(ell_max)
+        modulation = self.pattern.quasiperiodic_modulation(grid, phi_1, phi_2, dtype=dtype)
+        np.cos(modulation, out=modulation)
+        modulation *= envelope.astype(modulation.dtype)
+
+        return ell_array, modulation
+
+    def chi_squared_grid(self, observed_power, baseline_power, phi_1, phi_2=None, amplitudes=1.0,
+                         chunk_size=1 << 12):
+        """
+        anomaly_significance of many spectra against a grid of blink models
+
+        The model for frequencies (phi_1, phi_2) and amplitude A is
+        baseline * (1 + A * modulation(ℓ)). Each chunk of models is scored
+        against every spectrum at once from the residuals themselves, so
+        fits at and near the minimum do not cancel catastrophically.
+        Modulations are computed once per frequency pair and shared by all
+        amplitudes.
+
+        Args:
+            observed_power: Spectrum or (n_spectra, n_ell) stack over ℓ = 2 .. ell_max - 1
+            baseline_power: Standard-model spectrum over the same multipoles
+            phi_1: Frequency or array of frequencies
+            phi_2: Second frequencies, broadcast with phi_1 (default phi_1 / golden ratio)
+            amplitudes: Modulation amplitudes
+            chunk_size: (model, spectrum) pairs scored per pass
+
+        Returns:
+            χ² of shape phi.shape + (n_amplitudes, n_spectra), without the
+            spectrum axis when a single spectrum was given
+        """
+        observed = np.atleast_2d(np.asarray(observed_power, dtype=np.float64))
+        baseline = np.asarray(baseline_power, dtype=np.float64)
+        n_ell = observed.shape[1]
+        _, grid, envelope = self.ell_basis(n_ell + 2)
+
+        if phi_2 is None:
+            phi_1 = np.asarray(phi_1, dtype=float)
+            phi_2 = phi_1 / ((1 + np.sqrt(5)) / 2)
+        phi_1, phi_2 = np.broadcast_arrays(np.asarray(phi_1, dtype=float), np.asarray(phi_2, dtype=float))
+        pairs_1, pairs_2 = phi_1.ravel(), phi_2.ravel()
+        amplitudes = np.atleast_1d(np.asarray(amplitudes, dtype=np.float64))
+
+        chi_squared = np.empty((pairs_1.size, amplitudes.size, observed.shape[0]))
+        pairs_per_chunk = max(chunk_size // (amplitudes.size * observed.shape[0]), 1)
+        for start in range(0, pairs_1.size, pairs_per_chunk):
+            stop = min(start + pairs_per_chunk, pairs_1.size)
+            modulation = self.pattern.quasiperiodic_modulation(grid, pairs_1[start:stop], pairs_2[start:stop])
+            np.cos(modulation, out=modulation)
+            modulation *= envelope
+
+            predicted = baseline * (1 + amplitudes[None, :, None] * modulation[:, None, :])
+            predicted = predicted.reshape(-1, n_ell)
+            weight = 1 / (predicted + 1e-10)
+            scores = ((observed[None] - predicted[:, None])**2 * weight[:, None]).sum(axis=-1)
+            chi_squared[start:stop] = scores.reshape(stop - start, amplitudes.size, -1)
+
+        chi_squared = chi_squared.reshape(phi_1.shape + chi_squared.shape[1:])
+        return chi_squared[..., 0] if np.ndim(observed_power) == 1 else chi_squared
+
+    def anomaly_significance(self, observed_power, predicted_power):
+        """Calculate significance of deviations from standard model"""
+        residuals = observed_power - predicted_power
+        chi_squared = np.sum(residuals**2 / (predicted_power + 1e-10))
+
+        return chi_squared
 
-"""Analyze cosmic microwave background for blink signatures"""
-
-def __init__(self, blink_pattern):
-
-"""Initialize with cosmic blink pattern"""
-
-self.pattern = blink_pattern
-
-def predicted_cmb_multipole_modulation(self, ell_max=100):
-
-"""
-
-Predict how blink pattern modulates CMB power spectrum
-
-at different multipole moments ℓ
-
-"""
-
-ell_array = np.arange(2, ell_max)
-
-modulation = np.sin(np.pi * ell_array / 100.0) * np.cos(self.pattern.quasiperiodic_modulation(ell_array/100.0))
-
-return ell_array, modulation
-
-def anomaly_significance(self, observed_power, predicted_power):
-
-"""Calculate significance of deviations from standard model"""
-
-residuals = observed_power - predicted_power
-
-chi_squared = np.sum(residuals**2 / (predicted_power + 1e-10))
-
-return chi_squared
 
 class TesseractMapper:
-
-"""Map linguistic, rhythmic, and physical structures onto 4D tesseract"""
-
-def __init__(self, dimension=4, resolution=8):
-
-"""
-
-Initialize tesseract mapper
-
-Args:
-
-dimension: Dimensionality (default 4D)
-
-resolution: Resolution per dimension (8×8×8×8 = 4096 vertices)
-
-"""
-
-self.dim = dimension
-
-self.res = resolution
-
-self.vertices = self._generate_vertices()
-
-def _generate_vertices(self):
-
-"""Generate all vertices of hypercube"""
-
-vertices = []
-
-for i in range(self.res**self.dim):
-
-coords = []
-
-remaining = i
-
-for d in range(self.dim):
-
-coords.append(remaining % self.res)
-
-remaining //= self.res
-
-vertices.append(coords)
-
-return np.array(vertices)
-
-def color_by_subject_verb_object(self, linguistic_operators):
-
-"""
-
-Color tesseract vertices by linguistic structure
-
-Axes: (subject, verb, object, temporal)
-
-"""
-
-colors = []
-
-S = linguistic_operators.subject_operator()
-
-V = linguistic_operators.verb_operator()
-
-O = linguistic_operators.object_operator()
-
-for vertex in self.vertices:
-
-# Map vertex coordinates to eigenvalues
-
-s_val = vertex[0] / self.res
-
-v_val = vertex[1] / self.res
-
-o_val = vertex[2] / self.res
-
-# Combine linguistic measures
-
-color_value = s_val * np.linalg.norm(S) + v_val * np.linalg.norm(V) + o_val * np.linalg.norm(O)
-
-colors.append(color_value)
-
-return np.array(colors)
-
-def color_by_prime_gap_resonance(self, prime_gaps):
-
-"""
-
-Color tesseract vertices by resonance with prime gap pattern
-
-"""
-
-colors = []
-
-gap_mean = np.mean(prime_gaps)
-
-for vertex in self.vertices:
-
-# Use temporal axis for phase resonance
-
-time_phase = vertex[3] / self.res * 2 * np.pi
-
-# Resonance with dominant gaps
-
-resonance = sum(np.cos(time_phase * g / gap_mean) for g in prime_gaps[:10]) / 10
-
-colors.append(resonance)
-
-return np.array(colors)
-
-def edge_list_svo_order(self):
-
-"""
-
-Generate edge connections following Subject-Verb-Object causal order
-
-"""
-
-edges = []
-
-for i, vertex in enumerate(self.vertices):
-
-# Connect to vertices differing in linguistic progression
-
-# S→V: dimension 0→1 change
-
-# V→O: dimension 1→2 change
-
-# Temporal: dimension 3 progression
-
-for d in range(self.dim - 1):
-
-neighbor = vertex.copy()
-
-neighbor[d] = (neighbor[d] + 1) % self.res
-
-neighbor_idx = np.where((self.vertices == neighbor).all(axis=1))[0]
-
-if len(neighbor_idx) > 0:
-
-edges.append((i, neighbor_idx[0]))
-
-return edges
\ No newline at end of file
+    """Map linguistic, rhythmic, and physical structures onto 4D tesseract"""
+
+    def __init__(self, dimension=4, resolution=8, lazy=False):
+        """
+        Initialize tesseract mapper
+
+        Args:
+            dimension: Dimensionality (default 4D)
+            resolution: Resolution per dimension (8×8×8×8 = 4096 vertices)
+            lazy: Never build the vertex table up front; coordinates are
+                computed from flat vertex indices on demand
+        """
+        self.dim = dimension
+        self.res = resolution
+        self.n_vertices = resolution**dimension
+        self.coordinate_dtype = np.min_scalar_type(max(resolution - 1, 0))
+        # Flat index of a vertex is sum(coords[d] * res**d)
+        self.strides = resolution ** np.arange(dimension, dtype=np.int64)
+
+        if not lazy:
+            self.vertices
+
+    @cached_property
+    def vertices(self):
+        """Full (res**dim, dim) vertex table, axis 0 varying fastest"""
+        return self._generate_vertices()
+
+    def _generate_vertices(self):
+        """Generate all vertices of hypercube"""
+        vertices = np.empty((self.n_vertices, self.dim), dtype=self.coordinate_dtype)
+        values = np.arange(self.res, dtype=self.coordinate_dtype)
+        for d in range(self.dim):
+            # Each coordinate repeats res**d times and the pattern tiles the rest
+            column = np.repeat(values, self.res**d)
+            vertices[:, d].reshape(-1, column.size)[:] = column
+
+        return vertices
+
+    def vertex_coordinates(self, indices, axis=None):
+        """
+        Coordinates of vertices given their flat indices, without the table
+
+        Args:
+            indices: Flat vertex index or array of indices
+            axis: Return only this coordinate instead of all of them
+
+        Returns:
+            Array of shape indices.shape + (dim,), or indices.shape for an axis
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        if axis is not None:
+            return ((indices // self.strides[axis]) % self.res).astype(self.coordinate_dtype)
+
+        coords = np.empty(indices.shape + (self.dim,), dtype=self.coordinate_dtype)
+        for d in range(self.dim):
+            coords[..., d] = (indices // self.strides[d]) % self.res
+        return coords
+
+    def iter_vertices(self, chunk_size=1 << 16):
+        """Yield (first_index, coordinates) for consecutive blocks of vertices"""
+        for start in range(0, self.n_vertices, chunk_size):
+            stop = min(start + chunk_size, self.n_vertices)
+            yield start, self.vertex_coordinates(np.arange(start, stop))
+
+    def _axis_values(self, axis, indices=None):
+        """Coordinate along axis for flat vertex indices (default: every vertex)"""
+        if indices is None:
+            if "vertices" in self.__dict__:
+                return self.vertices[:, axis]
+            indices = np.arange(self.n_vertices)
+        return self.vertex_coordinates(indices, axis=axis)
+
+    def svo_color_tables(self, linguistic_operators):
+        """
+        Color contribution of each subject, verb and object coordinate
+
+        Args:
+            linguistic_operators: A LinguisticOperators, a sequence of them,
+                or a sequence of (S, V, O) matrix triples
+
+        Returns:
+            (tables, single): tables of shape (n_sets, 3, res), and whether a
+            single operator set was given
+        """
+        single = hasattr(linguistic_operators, "subject_operator")
+        operator_sets = [linguistic_operators] if single else list(linguistic_operators)
+        norms = np.empty((len(operator_sets), 3))
+        for k, operators in enumerate(operator_sets):
+            if hasattr(operators, "subject_operator"):
+                operators = (operators.subject_operator(), operators.verb_operator(),
+                             operators.object_operator())
+            norms[k] = [operator_norm(op) for op in operators]
+
+        levels = np.arange(self.res) / self.res
+        return levels[None, None, :] * norms[:, :, None], single
+
+    def color_by_subject_verb_object(self, linguistic_operators, indices=None):
+        """
+        Color tesseract vertices by linguistic structure
+        Axes: (subject, verb, object, temporal)
+
+        Each color is a sum of per-axis table lookups, so operator norms are
+        computed once per operator set rather than once per vertex.
+
+        Args:
+            linguistic_operators: A LinguisticOperators, a sequence of them,
+                or a sequence of (S, V, O) matrix triples
+            indices: Flat vertex indices to color (default: every vertex)
+
+        Returns:
+            Colors per vertex, with a leading axis over operator sets when a
+            sequence was given
+        """
+        tables, single = self.svo_color_tables(linguistic_operators)
+        colors = self._gather_svo(tables, indices)
+
+        return colors[0] if single else colors
+
+    def _gather_svo(self, tables, indices=None):
+        # Map vertex coordinates to eigenvalues and combine linguistic measures
+        colors = tables[:, 0, self._axis_values(0, indices)]
+        colors += tables[:, 1, self._axis_values(1, indices)]
+        colors += tables[:, 2, self._axis_values(2, indices)]
+        return colors
+
+    def resonance_tables(self, prime_gaps):
+        """
+        Resonance of every temporal coordinate value with each gap sequence
+
+        Args:
+            prime_gaps: A gap sequence, a 2D array of them, or a list of
+                sequences of different lengths
+
+        Returns:
+            (tables, single): tables of shape (n_sequences, res), and whether
+            a single sequence was given
+        """
+        single = np.ndim(prime_gaps[0]) == 0
+        sequences = [prime_gaps] if single else prime_gaps
+        # Use temporal axis for phase resonance
+        time_phase = np.arange(self.res) / self.res * 2 * np.pi
+
+        tables = np.empty((len(sequences), self.res))
+        for k, gaps in enumerate(sequences):
+            gaps = np.asarray(gaps)
+            # Resonance with dominant gaps
+            dominant = gaps[:10]
+            tables[k] = np.sum(np.cos(time_phase[:, None] * dominant[None, :] / np.mean(gaps)), axis=1) / 10
+
+        return tables, single
+
+    def color_by_prime_gap_resonance(self, prime_gaps, indices=None):
+        """
+        Color tesseract vertices by resonance with prime gap pattern
+
+        Resonance depends only on the temporal coordinate, so it is
+        evaluated for the res distinct values and gathered per vertex.
+
+        Args:
+            prime_gaps: A gap sequence, a 2D array of them, or a list of
+                sequences of different lengths
+            indices: Flat vertex indices to color (default: every vertex)
+
+        Returns:
+            Colors per vertex, with a leading axis over gap sequences when
+            several were given
+        """
+        tables, single = self.resonance_tables(prime_gaps)
+        colors = self._gather_resonance(tables, indices)
+
+        return colors[0] if single else colors
+
+    def _gather_resonance(self, tables, indices=None):
+        return tables[:, self._axis_values(3, indices)]
+
+    def _color_kernel(self, color, argument):
+        """Chunk colorer, whether one set was given, exact per-set bounds and set count"""
+        if callable(color):
+            sample = np.asarray(color(np.zeros(1, dtype=np.int64)))
+            n_sets = 1 if sample.ndim == 1 else sample.shape[0]
+            return color, sample.ndim == 1, None, n_sets
+
+        if color == "subject_verb_object":
+            tables, single = self.svo_color_tables(argument)
+            # Colors are monotone in each axis term, so extremes are table extremes
+            low = tables[:, 0].min(axis=1) + tables[:, 1].min(axis=1) + tables[:, 2].min(axis=1)
+            high = tables[:, 0].max(axis=1) + tables[:, 1].max(axis=1) + tables[:, 2].max(axis=1)
+            return (lambda indices: self._gather_svo(tables, indices)), single, (low, high), low.size
+        if color == "prime_gap_resonance":
+            tables, single = self.resonance_tables(argument)
+            bounds = (tables.min(axis=1), tables.max(axis=1))
+            return (lambda indices: self._gather_resonance(tables, indices)), single, bounds, tables.shape[0]
+        raise ValueError(f"Unknown color function: {color}")
+
+    def stream_colors(self, color, argument=None, out=None, chunk_dir=None, chunk_size=1 << 20,
+                      dtype=np.float64, bins=None, value_range=None):
+        """
+        Color every vertex chunk by chunk with bounded memory
+
+        The flat vertex index space is walked in blocks; coordinates are
+        decoded per block, so neither the vertex table nor the full color
+        array has to fit in memory. Each block can be written to a memmap
+        and/or its own .npy file, and is folded into running min/max and
+        fixed-edge histogram reductions.
+
+        Args:
+            color: "subject_verb_object", "prime_gap_resonance", or a callable
+                mapping flat indices to colors of shape (n,) or (sets, n)
+            argument: Operator set(s) or gap sequence(s) for a named color
+            out: Array, memmap or .npy path receiving all colors
+            chunk_dir: Directory for one colors_<start>.npy file per chunk
+            chunk_size: Vertices per chunk
+            dtype: Stored color dtype
+            bins: Histogram bins per color set (no histogram when None)
+            value_range: (low, high) histogram range; named colors default
+                to their exact value bounds
+
+        Returns:
+            Dictionary with per-set "min", "max", "histogram" and "bin_edges"
+            (None without bins), and "out"
+        """
+        gather, single, bounds, n_sets = self._color_kernel(color, argument)
+        shape = (self.n_vertices,) if single else (n_sets, self.n_vertices)
+
+        if isinstance(out, (str, os.PathLike)):
+            out = np.lib.format.open_memmap(out, mode="w+", dtype=dtype, shape=shape)
+        elif out is not None and out.shape != shape:
+            raise ValueError(f"out must have shape {shape}")
+        rows = None if out is None else out.reshape(n_sets, self.n_vertices)
+
+        edges = histogram = None
+        if bins is not None:
+            if value_range is not None:
+                low, high = (np.full(n_sets, float(v)) for v in value_range)
+            elif bounds is not None:
+                low, high = (np.asarray(b, dtype=float) for b in bounds)
+            else:
+                raise ValueError("value_range is required to histogram a custom color")
+            # Degenerate ranges widen like np.histogram
+            flat = low == high
+            low, high = np.where(flat, low - 0.5, low), np.where(flat, high + 0.5, high)
+            edges = np.linspace(low, high, bins + 1, axis=1)
+            histogram = np.zeros((n_sets, bins), dtype=np.int64)
+
+        minimum = np.full(n_sets, np.inf)
+        maximum = np.full(n_sets, -np.inf)
+        for start in range(0, self.n_vertices, chunk_size):
+            stop = min(start + chunk_size, self.n_vertices)
+            colors = np.asarray(gather(np.arange(start, stop)), dtype=dtype).reshape(n_sets, -1)
+
+            if rows is not None:
+                rows[:, start:stop] = colors
+            if chunk_dir is not None:
+                np.save(os.path.join(chunk_dir, f"colors_{start:012d}.npy"), colors[0] if single else colors)
+
+            np.minimum(minimum, colors.min(axis=1), out=minimum)
+            np.maximum(maximum, colors.max(axis=1), out=maximum)
+            if histogram is not None:
+                scaled = (colors - low[:, None]) / (high - low)[:, None] * bins
+                inside = (scaled >= 0) & (scaled <= bins)
+                codes = np.minimum(scaled, bins - 1).astype(np.int64) + bins * np.arange(n_sets)[:, None]
+                histogram += np.bincount(codes[inside], minlength=n_sets * bins).reshape(n_sets, bins)
+
+        if isinstance(out, np.memmap):
+            out.flush()
+        if single:
+            minimum, maximum = minimum[0], maximum[0]
+            if histogram is not None:
+                histogram, edges = histogram[0], edges[0]
+        return {"min": minimum, "max": maximum, "histogram": histogram, "bin_edges": edges, "out": out}
+
+    def _index_dtype(self, max_value=None):
+        """int32 when every index (default: vertex indices) fits, else int64"""
+        max_value = self.n_vertices if max_value is None else max_value
+        return np.dtype(np.int32) if max_value < 2**31 else np.dtype(np.int64)
+
+    def svo_neighbors(self, start=0, stop=None):
+        """
+        SVO successors of vertices start..stop-1 by stride arithmetic
+
+        Along each non-temporal axis d the successor has coordinate
+        (c + 1) % res, i.e. flat index i + res**d, wrapping back by
+        (res - 1) * res**d at the edge of the axis.
+
+        Returns:
+            Array of shape (stop - start, dim - 1) of flat neighbor indices
+        """
+        stop = self.n_vertices if stop is None else stop
+        indices = np.arange(start, stop, dtype=np.int64)
+        neighbors = np.empty((indices.size, self.dim - 1), dtype=self._index_dtype())
+        for d in range(self.dim - 1):
+            wraps = self.vertex_coordinates(indices, axis=d) == self.res - 1
+            step = np.where(wraps, -(self.res - 1) * self.strides[d], self.strides[d])
+            neighbors[:, d] = indices + step
+        return neighbors
+
+    def edge_list_svo_order(self, chunk_size=1 << 20):
+        """
+        Generate edge connections following Subject-Verb-Object causal order
+
+        Returns:
+            (n_edges, 2) array of (vertex, neighbor) flat indices, vertex-major
+            with one edge per non-temporal axis
+        """
+        # Connect to vertices differing in linguistic progression
+        # S→V: dimension 0→1 change
+        # V→O: dimension 1→2 change
+        # Temporal: dimension 3 progression
+        per_vertex = max(self.dim - 1, 0)
+        edges = np.empty((self.n_vertices * per_vertex, 2), dtype=self._index_dtype())
+        edges[:, 0] = np.repeat(np.arange(self.n_vertices, dtype=edges.dtype), per_vertex)
+        for start in range(0, self.n_vertices if per_vertex else 0, chunk_size):
+            stop = min(start + chunk_size, self.n_vertices)
+            edges[start * per_vertex:stop * per_vertex, 1] = self.svo_neighbors(start, stop).ravel()
+
+        return edges
+
+    def svo_adjacency(self, symmetric=False, chunk_size=1 << 20):
+        """
+        Sparse CSR adjacency of the SVO edge list
+
+        Every vertex has exactly dim - 1 successors, so the row pointer is
+        a plain arithmetic sequence and the column array is filled chunk by
+        chunk without ever forming the edge list.
+
+        Args:
+            symmetric: Add the reverse of every edge (undirected graph)
+            chunk_size: Vertices processed per pass
+
+        Returns:
+            scipy.sparse.csr_matrix of shape (res**dim, res**dim)
+        """
+        per_vertex = max(self.dim - 1, 0)
+        # scipy keeps indices and indptr in one dtype, and indptr reaches nnz
+        dtype = self._index_dtype(max(self.n_vertices, self.n_vertices * per_vertex))
+        indices = np.empty(self.n_vertices * per_vertex, dtype=dtype)
+        for start in range(0, self.n_vertices if per_vertex else 0, chunk_size):
+            stop = min(start + chunk_size, self.n_vertices)
+            indices[start * per_vertex:stop * per_vertex] = self.svo_neighbors(start, stop).ravel()
+        indptr = np.arange(self.n_vertices + 1, dtype=dtype) * per_vertex
+
+        adjacency = csr_matrix((np.ones(indices.size, dtype=np.int8), indices, indptr),
+                               shape=(self.n_vertices, self.n_vertices))
+        if symmetric:
+            adjacency = (adjacency + adjacency.T).tocsr()
+        # Collapses the repeated self-loops that appear at resolution 1
+        adjacency.sum_duplicates()
+        return adjacency
@@ -1,204 +1,127 @@
 """
-
 Core mathematical formulations for Black/White Hole quantum dynamics
-
 """
 
 import numpy as np
-
 from scipy.integrate import odeint
-
 from scipy.special import spherical_jn
-
 import cmath
 
-class BlackWhiteHoleSystem:
-
-"""
-
-Schwarzschild metric and Kruskal-Szekeres coordinate system
-
-with quantum bounce and superposition dynamics
-
-"""
-
-def __init__(self, mass=1.0, planck_mass=2.176e-8):
-
-"""
-
-Initialize BH/WH system
-
-Args:
-
-mass: Black hole mass (in solar masses or natural units)
-
-planck_mass: Planck mass for quantum corrections
-
-"""
-
-self.M = mass
-
-self.m_pl = planck_mass
-
-self.schwarzschild_radius = 2 * mass # G=c=1 units
-
-def schwarzschild_metric(self, r, t=0):
-
-"""
-
-Schwarzschild metric: ds^2 = -(1-2M/r)dt^2 + (1-2M/r)^-1 dr^2 + r^2(dθ^2 + sin^2θ dφ^2)
-
-Returns:
-
-Metric tensor components as dictionary
-
-"""
-
-if r <= self.schwarzschild_radius:
-
-raise ValueError("Inside event horizon")
-
-g_tt = -(1 - 2*self.M / r)
-
-g_rr = 1 / (1 - 2*self.M / r)
-
-g_theta_theta = r**2
-
-g_phi_phi = r**2 * np.sin(0)**2 # At theta=0 for simplicity
-
-return {
-
-"g_tt": g_tt,
-
-"g_rr": g_rr,
-
-"g_theta_theta": g_theta_theta,
-
-"g_phi_phi": g_phi_phi
-
-}
-
-def kruskal_szekeres_transform(self, t, r):
-
-"""
-
-Transform Schwarzschild (t,r) to Kruskal-Szekeres (T_K, R_K) coordinates
-
-Captures black hole, white hole, and parallel universe regions
-
-"""
-
-if r <= self.schwarzschild_radius:
-
-raise ValueError("Inside event horizon")
-
-# Kruskal transformation
-
-factor = (r / (2*self.M) - 1)**(0.5) * np.exp(r / (4*self.M))
-
-T_K = factor * np.sinh(t / (4*self.M))
-
-R_K = factor * np.cosh(t / (4*self.M))
 
-return T_K, R_K
-
-def quantum_bounce_correction(self, energy, density):
-
-"""
-
-Loop quantum gravity correction to Friedmann equation
-
-(H')^2 = (8πG/3)ρ(1 - ρ/ρ_c)
-
-where ρ_c is critical Planck density
-
-"""
-
-rho_critical = (self.m_pl)**2 # Planck density
-
-correction_factor = 1 - density / rho_critical
-
-return energy * np.sqrt(correction_factor)
-
-def black_to_white_transition_amplitude(self, time_planck, rhythm_modulation=1.0):
-
-"""
-
-Quantum amplitude for black hole → white hole transition
-
-A_BW ∝ exp(i S_eff / ℏ) where S_eff includes LQG bounce
-
-"""
-
-# WKB approximation for tunneling amplitude
-
-action = (self.M**2 / self.m_pl) * time_planck
-
-phase = rhythm_modulation * action
-
-amplitude = np.exp(1j * phase)
+class BlackWhiteHoleSystem:
+    """
+    Schwarzschild metric and Kruskal-Szekeres coordinate system
+    with quantum bounce and superposition dynamics
+    """
+
+    def __init__(self, mass=1.0, planck_mass=2.176e-8):
+        """
+        Initialize BH/WH system
+
+        Args:
+            mass: Black hole mass (in solar masses or natural units)
+            planck_mass: Planck mass for quantum corrections
+        """
+        self.M = mass
+        self.m_pl = planck_mass
+        self.schwarzschild_radius = 2 * mass  # G=c=1 units
+
+    def schwarzschild_metric(self, r, t=0):
+        """
+        Schwarzschild metric: ds^2 = -(1-2M/r)dt^2 + (1-2M/r)^-1 dr^2 + r^2(dθ^2 + sin^2θ dφ^2)
+
+        Returns:
+            Metric tensor components as dictionary
+        """
+        if r <= self.schwarzschild_radius:
+            raise ValueError("Inside event horizon")
+
+        g_tt = -(1 - 2*self.M / r)
+        g_rr = 1 / (1 - 2*self.M / r)
+        g_theta_theta = r**2
+        g_phi_phi = r**2 * np.sin(0)**2  # At theta=0 for simplicity
+
+        return {
+            "g_tt": g_tt,
+            "g_rr": g_rr,
+            "g_theta_theta": g_theta_theta,
+            "g_phi_phi": g_phi_phi
+        }
+
+    def kruskal_szekeres_transform(self, t, r):
+        """
+        Transform Schwarzschild (t,r) to Kruskal-Szekeres (T_K, R_K) coordinates
+        Captures black hole, white hole, and parallel universe regions
+        """
+        if r <= self.schwarzschild_radius:
+            raise ValueError("Inside event horizon")
+
+        # Kruskal transformation
+        factor = (r / (2*self.M) - 1)**(0.5) * np.exp(r / (4*self.M))
+        T_K = factor * np.sinh(t / (4*self.M))
+        R_K = factor * np.cosh(t / (4*self.M))
+
+        return T_K, R_K
+
+    def quantum_bounce_correction(self, energy, density):
+        """
+        Loop quantum gravity correction to Friedmann equation
+        (H')^2 = (8πG/3)ρ(1 - ρ/ρ_c)
+        where ρ_c is critical Planck density
+        """
+        rho_critical = (self.m_pl)**2  # Planck density
+        correction_factor = 1 - density / rho_critical
+
+        return energy * np.sqrt(correction_factor)
+
+    def black_to_white_transition_amplitude(self, time_planck, rhythm_modulation=1.0):
+        """
+        Quantum amplitude for black hole → white hole transition
+        A_BW ∝ exp(i S_eff / ℏ) where S_eff includes LQG bounce
+        """
+        # WKB approximation for tunneling amplitude
+        action = (self.M**2 / self.m_pl) * time_planck
+        phase = rhythm_modulation * action
+        amplitude = np.exp(1j * phase)
+
+        return amplitude
 
-return amplitude
 
 class SuperpositionState:
-
-"""
-
-Quantum superposition of black and white hole states
-
-"""
-
-def __init__(self, alpha=1/np.sqrt(2), beta=1/np.sqrt(2), phase_diff=0):
-
-"""
-
-|Ψ_BW⟩ = α|Black⟩ + β e^(iφ)|White⟩
-"""
-
-self.alpha = alpha
-
-self.beta = beta
-
-self.phase_diff = phase_diff
-
-def state_vector(self):
-
-"""Return superposition state as complex vector"""
-
-return np.array([
-
-self.alpha,
-
-self.beta * np.exp(1j * self.phase_diff)
-
-])
-
-def density_matrix(self):
-
-"""Return density matrix ρ = |Ψ⟩⟨Ψ|"""
-
-psi = self.state_vector()
-
-return np.outer(psi, np.conj(psi))
-
-def purity(self):
-
-"""Calculate purity Tr(ρ²)"""
-
-rho = self.density_matrix()
-
-return np.trace(rho @ rho).real
-
-def entanglement_entropy(self):
-
-"""Von Neumann entropy of superposition"""
-
-rho = self.density_matrix()
-
-eigenvalues = np.linalg.eigvalsh(rho)
-
-eigenvalues = eigenvalues[eigenvalues > 1e-10] # Filter out numerical zeros
-
-entropy = -np.sum(eigenvalues * np.log2(eigenvalues))
-
-return entropy
\ No newline at end of file
+    """
+    Quantum superposition of black and white hole states
+    """
+
+    def __init__(self, alpha=1/np.sqrt(2), beta=1/np.sqrt(2), phase_diff=0):
+        """
+        |Ψ_BW⟩ = α|Black⟩ + β e^(iφ)|White⟩
+        """
+        self.alpha = alpha
+        self.beta = beta
+        self.phase_diff = phase_diff
+
+    def state_vector(self):
+        """Return superposition state as complex vector"""
+        return np.array([
+            self.alpha,
+            self.beta * np.exp(1j * self.phase_diff)
+        ])
+
+    def density_matrix(self):
+        """Return density matrix ρ = |Ψ⟩⟨Ψ|"""
+        psi = self.state_vector()
+        return np.outer(psi, np.conj(psi))
+
+    def purity(self):
+        """Calculate purity Tr(ρ²)"""
+        rho = self.density_matrix()
+        return np.trace(rho @ rho).real
+
+    def entanglement_entropy(self):
+        """Von Neumann entropy of superposition"""
+        rho = self.density_matrix()
+        eigenvalues = np.linalg.eigvalsh(rho)
+        eigenvalues = eigenvalues[eigenvalues > 1e-10]  # Filter out numerical zeros
+        entropy = -np.sum(eigenvalues * np.log2(eigenvalues))
+
+        return entropy
@@ -1,203 +1,689 @@
 """
-
 Cosmic blinking patterns modulated by prime gaps and rhythmic structures
-
 """
 
-import numpy as np
-
-from scipy.special import zetazero
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 
-def generate_primes(n_max=100):
+import numpy as np
 
-"""Generate prime numbers up to n_max using Sieve of Eratosthenes"""
+from .io import PrimeDatabase, ZetaZeroTable
+from .sieve import (
+    SEGMENT_ODDS,
+    iter_primes,
+    nth_prime_upper_bound,
+    prime_dtype,
+    primes_in_range,
+    resolve_workers,
+)
+from .zeta import zeta_zeros
 
-is_prime = [True] * (n_max + 1)
+# Prime gaps below 2**64 never exceed 1550, so 16 bits always suffice
+GAP_DTYPE = np.dtype(np.int16)
 
-is_prime[0] = is_prime[1] = False
 
-for i in range(2, int(n_max**0.5) + 1):
+def generate_primes(n_max=100, segment_size=SEGMENT_ODDS, workers=None):
+    """
+    Generate prime numbers up to n_max using a segmented Sieve of Eratosthenes
 
-if is_prime[i]:
+    Only odd numbers are sieved, one cache-sized segment at a time, so the
+    working set stays fixed no matter how large n_max is.
 
-for j in range(i*i, n_max + 1, i):
+    Args:
+        n_max: Inclusive upper bound
+        segment_size: Odd numbers sieved per segment
+        workers: Processes sieving segments in parallel (-1 for all cores)
 
-is_prime[j] = False
+    Returns:
+        Integer NumPy array of primes in increasing order
+    """
+    return primes_in_range(2, n_max + 1, segment_size, workers)
 
-return [i for i in range(2, n_max + 1) if is_prime[i]]
 
 def prime_gaps(primes):
+    """Calculate gaps between consecutive primes"""
+    return np.diff(np.asarray(primes))
+
+
+def iter_prime_gaps(chunk_size=1 << 20, start=2, stop=None, segment_size=SEGMENT_ODDS):
+    """
+    Stream prime gaps in NumPy chunks from an incremental segmented sieve
+
+    The gap spanning two sieve segments is carried over, so concatenating
+    the chunks gives exactly prime_gaps(primes in [start, stop)).
+
+    Args:
+        chunk_size: Gaps per yielded chunk (the last chunk may be shorter)
+        start: Lower bound of the primes considered
+        stop: Exclusive upper bound, or None to stream forever
+        segment_size: Odd numbers sieved per segment
+
+    Yields:
+        int32 arrays of consecutive prime gaps
+    """
+    pending = []
+    n_pending = 0
+    previous = None
+
+    for primes in iter_primes(start, stop, segment_size):
+        if primes.size == 0:
+            continue
+        if previous is None:
+            gaps = np.diff(primes)
+        else:
+            gaps = np.diff(primes, prepend=previous)
+        previous = primes[-1]
+
+        pending.append(gaps.astype(np.int32))
+        n_pending += gaps.size
+        if n_pending < chunk_size:
+            continue
+
+        block = np.concatenate(pending)
+        n_full = block.size - block.size % chunk_size
+        for i in range(0, n_full, chunk_size):
+            yield block[i:i + chunk_size]
+        pending = [block[n_full:]]
+        n_pending = block.size - n_full
+
+    if n_pending:
+        yield np.concatenate(pending)
+
+
+class GapStatistics:
+    """
+    Running aggregates of a gap sequence, updated in O(new gaps)
+
+    Keeps the count, sum, minimum, maximum and a histogram of gap values,
+    which is all the blink entropy and normalisations need. Real-valued
+    gaps (zeta zero spacings) have no histogram; their entropy comes from
+    a running sum of g log2 g instead.
+    """
+
+    def __init__(self, gaps=()):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.histogram = np.zeros(0, dtype=np.int64)
+        self.weighted_log = 0.0
+        self.update(gaps)
+
+    def update(self, gaps):
+        """Fold a new chunk of gaps into the aggregates"""
+        gaps = np.asarray(gaps)
+        if gaps.size == 0:
+            return self
+
+        chunk_min = np.min(gaps).item()
+        chunk_max = np.max(gaps).item()
+        self.count += gaps.size
+        self.min = chunk_min if self.min is None else min(self.min, chunk_min)
+        self.max = chunk_max if self.max is None else max(self.max, chunk_max)
+
+        if not np.issubdtype(gaps.dtype, np.integer):
+            self.total += float(np.sum(gaps, dtype=np.float64))
+            self.weighted_log += float(np.sum(gaps * np.log2(gaps)))
+            self.histogram = None
+            return self
+
+        self.total += int(np.sum(gaps, dtype=np.int64))
+        chunk_counts = np.bincount(gaps)
+        if chunk_counts.size > self.histogram.size:
+            self.histogram = np.pad(self.histogram, (0, chunk_counts.size - self.histogram.size))
+        self.histogram[:chunk_counts.size] += chunk_counts
+
+        return self
+
+    @property
+    def mean(self):
+        return self.total / self.count
+
+    def entropy(self):
+        """Blink entropy of every gap seen so far"""
+        if self.histogram is None:
+            # -sum p log2 p with p = g / total, without the 1e-10 regulariser
+            return np.log2(self.total) - self.weighted_log / self.total
+        return entropy_from_histogram(self.histogram)
+
+
+def gap_histogram(gap_chunks):
+    """
+    Count how often each gap value occurs across a stream of gap chunks
+
+    Returns:
+        Array whose entry g is the number of gaps equal to g
+    """
+    statistics = GapStatistics()
+    for chunk in gap_chunks:
+        statistics.update(chunk)
+    return statistics.histogram
+
+
+def entropy_from_histogram(counts):
+    """
+    Shannon entropy of a blink pattern given its gap histogram
+
+    Matches CosmicBlinkPattern.information_content_blink, where each gap g
+    carries probability g / sum(gaps).
+    """
+    values = np.flatnonzero(counts)
+    multiplicity = counts[values]
+    probabilities = values / np.sum(values * multiplicity)
+    return -np.sum(multiplicity * probabilities * np.log2(probabilities + 1e-10))
+
+
+def information_content_stream(gap_chunks):
+    """
+    Shannon entropy of an arbitrarily long gap stream in constant memory
+    """
+    return entropy_from_histogram(gap_histogram(gap_chunks))
+
+
+def _log_slope(scales, measures):
+    """Slope of log10(measure + 1) against log10(scale)"""
+    return np.polyfit(np.log10(scales), np.log10(np.asarray(measures) + 1), 1)[0]
+
+
+def _modulo_dimension(values, weights, n_scales, chunk_size):
+    """
+    Original modulo estimator evaluated on (value, multiplicity) pairs
+
+    Integer gaps collapse to their histogram, so the cost depends on the
+    number of distinct gaps rather than on the length of the sequence.
+    """
+    scales = np.logspace(0, np.log10(np.max(values)), n_scales)
+    counts = np.zeros(n_scales)
+    for start in range(0, values.size, chunk_size):
+        v = values[start:start + chunk_size]
+        w = weights[start:start + chunk_size]
+        hits = (v[None, :] % scales[:, None]) < scales[:, None] / 2
+        counts += hits @ w
+    return -_log_slope(scales, counts)
+
+
+def _position_scales(gaps, n_scales):
+    """Box sizes / radii from the smallest gap up to 1/16 of the total span"""
+    total = float(np.sum(gaps, dtype=np.float64))
+    # Float gaps (zeta zero spacings) go below 1, so floor at the smallest
+    # positive gap rather than at the unit integer gap
+    positive = gaps[gaps > 0]
+    smallest = float(np.min(positive)) if positive.size else 1.0
+    return np.logspace(np.log10(smallest), np.log10(max(total / 16, 2 * smallest)), n_scales)
+
+
+def _box_dimension(gaps, n_scales, chunk_size):
+    """Box-counting dimension of the blink positions, one chunk at a time"""
+    scales = _position_scales(gaps, n_scales)
+    counts = np.zeros(n_scales, dtype=np.int64)
+
+    # No box can be skipped once it is at least as wide as the largest gap
+    first = float(gaps[0])
+    last = float(np.sum(gaps, dtype=np.float64))
+    wide = scales >= np.max(gaps)
+    counts[wide] = np.floor(last / scales[wide]) - np.floor(first / scales[wide]) + 1
+
+    narrow = np.flatnonzero(~wide)
+    previous = np.full(n_scales, -1.0)
+    offset = 0.0
+    for start in range(0, gaps.size if narrow.size else 0, chunk_size):
+        positions = offset + np.cumsum(gaps[start:start + chunk_size], dtype=np.float64)
+        offset = positions[-1]
+        boxes = np.empty_like(positions)
+        for k in narrow:
+            np.multiply(positions, 1 / scales[k], out=boxes)
+            np.floor(boxes, out=boxes)
+            counts[k] += np.count_nonzero(boxes[1:] != boxes[:-1]) + (boxes[0] != previous[k])
+            previous[k] = boxes[-1]
+
+    return -_log_slope(scales, counts)
+
+
+def _correlation_dimension(gaps, n_scales, max_points, rng, chunk_size):
+    """Grassberger-Procaccia dimension on a random subset of blink positions"""
+    radii = _position_scales(gaps, n_scales)
+    positions = np.cumsum(gaps, dtype=np.float64)
+    if positions.size > max_points:
+        positions = np.sort(rng.choice(positions, max_points, replace=False))
+
+    # Pairs closer than r: for each point, the sorted points within r ahead of it
+    pairs = np.zeros(n_scales)
+    for start in range(0, positions.size, chunk_size):
+        x = positions[start:start + chunk_size]
+        own = np.arange(start, start + x.size)
+        for k, r in enumerate(radii):
+            pairs[k] += np.sum(np.searchsorted(positions, x + r, side='left') - own - 1)
+
+    return _log_slope(radii, pairs)
+
+
+def _block_resample(gaps, rng, block=1024):
+    """Moving-block bootstrap resample of a gap sequence"""
+    n_blocks = -(-gaps.size // block)
+    starts = rng.integers(0, max(gaps.size - block, 0) + 1, n_blocks)
+    indices = (starts[:, None] + np.arange(block)).ravel()[:gaps.size]
+    return gaps[np.minimum(indices, gaps.size - 1)]
 
-"""Calculate gaps between consecutive primes"""
-
-return [primes[i+1] - primes[i] for i in range(len(primes)-1)]
 
 class CosmicBlinkPattern:
-
-"""
-
-Universe blinking according to prime gap sequence and quasiperiodic rhythms
-
-"""
-
-def __init__(self, n_primes=1000, planck_time=5.39e-44, age_of_universe=4.4e17):
-
-"""
-
-Initialize cosmic blink pattern
-
-Args:
-
-n_primes: Number of primes to use
-
-planck_time: Planck time scale (seconds)
-
-age_of_universe: Age in Planck times
-
-"""
-
-self.primes = generate_primes(n_primes)
-
-self.gaps = prime_gaps(self.primes)
-
-self.t_p = planck_time
-
-self.t_universe = age_of_universe * planck_time
-
-# Normalize gaps to time scale
-
-gap_array = np.array(self.gaps)
-
-self.blink_times = np.cumsum(gap_array) * planck_time / np.max(gap_array)
-
-def blink_operator(self, t):
-
-"""
-
-Blink operator: δ(t - t_blink,n) at prime gap times
-
-"""
-
-tolerance = 1e-10
-
-return sum(1 for t_b in self.blink_times if abs(t - t_b) < tolerance)
-
-def quasiperiodic_modulation(self, t, phi_1=None, phi_2=None):
-
-"""
-
-Quasiperiodic modulation with golden ratio incommensurability
-
-ω(t) = ω_1 cos(2π φ_1 t) + ω_2 cos(2π φ_2 t)
-
-where φ_1/φ_2 = φ (golden ratio)
-
-"""
-
-phi_golden = (1 + np.sqrt(5)) / 2
-
-if phi_1 is None:
-
-phi_1 = 1.0
-
-if phi_2 is None:
-
-phi_2 = phi_1 / phi_golden
-
-omega_1 = np.cos(2 * np.pi * phi_1 * t)
-
-omega_2 = np.cos(2 * np.pi * phi_2 * t)
-
-return omega_1 + omega_2
-
-def eigenvalue_bifurcation_sequence(self):
-
-"""
-
-Eigenvalue crossing sequence corresponding to blink pattern
-
-Returns:
-
-Array of eigenvalues at bifurcation points (modulated by gaps)
-
-"""
-
-gap_array = np.array(self.gaps)
-
-# Normalize to [-1, 1] range for eigenvalues
-
-eigenvalues = 2 * (gap_array - np.min(gap_array)) / (np.max(gap_array) - np.min(gap_array)) - 1
-
-return eigenvalues
-
-def multiverse_branching_probability(self, blink_index):
-
-"""
-
-Probability of multiverse branching at nth blink
-
-Proportional to prime gap size (larger gap = more branches)
-
-"""
-
-if blink_index >= len(self.gaps):
-
-return 0
-
-gap = self.gaps[blink_index]
-
-# Normalize to probability
-
-max_gap = max(self.gaps)
-
-return gap / max_gap
-
-def information_content_blink(self):
-
-"""
-
-Shannon entropy of blink pattern (information content)
-
-"""
-
-gap_array = np.array(self.gaps)
-
-probabilities = gap_array / np.sum(gap_array)
-
-entropy = -np.sum(probabilities * np.log2(probabilities + 1e-10))
-
-return entropy
-
-def fractal_dimension(self):
-
-"""
-
-Estimate fractal dimension of prime gap distribution
-
-"""
-
-gap_array = np.array(self.gaps)
-
-# Box-counting approximation
-
-scales = np.logspace(0, np.log10(np.max(gap_array)), 20)
-
-counts = []
-
-for scale in scales:
-
-count = np.sum((gap_array % scale) < scale / 2)
-
-counts.append(count)
-
-# Fit log-log to get fractal dimension
-
-log_scales = np.log10(scales)
-
-log_counts = np.log10(np.array(counts) + 1)
-
-coefficients = np.polyfit(log_scales, log_counts, 1)
-
-fractal_dim = -coefficients[0] # Negative slope in log-log plot
-
-return fractal_dim
\ No newline at end of file
+    """
+    Universe blinking according to prime gap sequence and quasiperiodic rhythms
+    """
+
+    def __init__(self, n_primes=1000, planck_time=5.39e-44, age_of_universe=4.4e17,
+                 prime_cache=None, lazy=False, source="primes", zero_cache=None):
+        """
+        Initialize cosmic blink pattern
+
+        Args:
+            n_primes: Number of primes (or zeta zeros) to use
+            planck_time: Planck time scale (seconds)
+            age_of_universe: Age in Planck times
+            prime_cache: Optional PrimeDatabase (or path to one) to read primes
+                from instead of sieving
+            lazy: Defer computing primes, gaps and blink_times until first use
+            source: "primes" for prime gaps, or "zeta" to blink at the spacings
+                between consecutive nontrivial Riemann zeta zeros
+            zero_cache: Optional ZetaZeroTable (or path to one) holding the
+                zeros for source="zeta"
+        """
+        if source not in ("primes", "zeta"):
+            raise ValueError(f"Unknown blink source: {source}")
+        if prime_cache is not None and not isinstance(prime_cache, PrimeDatabase):
+            prime_cache = PrimeDatabase(prime_cache)
+        if zero_cache is not None and not isinstance(zero_cache, ZetaZeroTable):
+            zero_cache = ZetaZeroTable(zero_cache)
+
+        self.n_primes = n_primes
+        self.source = source
+        self.prime_cache = prime_cache
+        self.zero_cache = zero_cache
+        self.t_p = planck_time
+        self.t_universe = age_of_universe * planck_time
+
+        if not lazy:
+            # Materialize the derived arrays up front
+            self.zeros if source == "zeta" else self.primes
+            self.blink_times
+
+    def _sieve(self):
+        """
+        The first n_primes primes, from the cache when one is attached
+
+        A single sieve is sized by the nth-prime upper bound.
+        """
+        limit = nth_prime_upper_bound(self.n_primes)
+        if self.prime_cache is None:
+            return generate_primes(limit)[:self.n_primes]
+        primes = self.prime_cache.primes(self.n_primes)
+        return primes.astype(prime_dtype(limit), copy=False)
+
+    @cached_property
+    def primes(self):
+        """Primes driving the pattern"""
+        return self._sieve()
+
+    @cached_property
+    def zeros(self):
+        """Ordinates of the first n_primes zeta zeros driving a zeta pattern"""
+        if self.source != "zeta":
+            raise ValueError("zeros are only defined for source='zeta'")
+        if self.zero_cache is None:
+            return zeta_zeros(self.n_primes)
+        return np.array(self.zero_cache.zeros(self.n_primes))
+
+    @cached_property
+    def gaps(self):
+        """
+        Gaps between consecutive primes as a compact integer array, or the
+        float64 spacings between consecutive zeros for source="zeta"
+        """
+        if self.source == "zeta":
+            return np.diff(self.zeros)
+
+        # Reuse the primes if already materialized, otherwise sieve without keeping them
+        primes = self.__dict__.get("primes")
+        if primes is None:
+            primes = self._sieve()
+        return prime_gaps(primes).astype(GAP_DTYPE)
+
+    @cached_property
+    def blink_times(self):
+        """Blink times: cumulative gaps normalized to the Planck time scale"""
+        return np.cumsum(self.gaps, dtype=np.float64) * self.t_p / self.statistics.max
+
+    @cached_property
+    def statistics(self):
+        """Running gap aggregates shared by the entropy and normalisations"""
+        return GapStatistics(self.gaps)
+
+    def extend(self, new_limit):
+        """
+        Grow the pattern to every prime up to new_limit
+
+        Only the range past the current last prime is sieved. Materialized
+        arrays get the new primes, gaps and blink times appended, and the
+        running statistics absorb the new gaps, so the entropy and
+        normalisations update in O(new data). Blink times are rescaled in
+        place only when the maximum gap grows.
+
+        Returns:
+            self
+        """
+        if self.source != "primes":
+            raise ValueError("extend is only available for prime-driven patterns")
+        statistics = self.statistics
+        last_prime = 2 + statistics.total
+        if new_limit <= last_prime:
+            return self
+
+        new_primes = primes_in_range(last_prime + 1, new_limit + 1)
+        new_gaps = np.diff(new_primes, prepend=last_prime).astype(GAP_DTYPE)
+
+        old_total = statistics.total
+        old_max = statistics.max
+        statistics.update(new_gaps)
+
+        cached = self.__dict__
+        if "primes" in cached:
+            dtype = prime_dtype(new_limit)
+            cached["primes"] = np.concatenate((cached["primes"].astype(dtype, copy=False),
+                                               new_primes.astype(dtype, copy=False)))
+        if "gaps" in cached:
+            cached["gaps"] = np.concatenate((cached["gaps"], new_gaps))
+        if "blink_times" in cached:
+            scale = self.t_p / statistics.max
+            blink_times = cached["blink_times"]
+            if statistics.max != old_max:
+                blink_times *= old_max / statistics.max
+            new_times = (old_total + np.cumsum(new_gaps, dtype=np.float64)) * scale
+            cached["blink_times"] = np.concatenate((blink_times, new_times))
+
+        self.n_primes += new_primes.size
+        return self
+
+    def blink_operator(self, t, tolerance=1e-10, return_nearest=False):
+        """
+        Blink operator: δ(t - t_blink,n) at prime gap times
+
+        Blinks within the tolerance window are counted with a binary search
+        on the sorted blink times, so each query costs O(log n).
+
+        Args:
+            t: Query time or array of query times
+            tolerance: Half-width of the open window |t - t_blink| < tolerance
+            return_nearest: Also return the nearest blink index and distance
+
+        Returns:
+            Hit counts with the shape of t, or (counts, nearest_index, distance)
+            when return_nearest is set
+        """
+        t = np.asarray(t, dtype=float)
+        times = self.blink_times
+        if times.size == 0:
+            if return_nearest:
+                raise ValueError("A pattern without blinks has no nearest blink")
+            counts = np.zeros(t.shape, dtype=np.int64)
+            return counts if t.ndim else 0
+
+        # Search a closed window, then apply the exact open-window test to the
+        # two edge blinks, which rounding of t ± tolerance may misplace
+        lower = np.searchsorted(times, t - tolerance, side='left')
+        upper = np.searchsorted(times, t + tolerance, side='right')
+        counts = upper - lower
+        for edge in (lower, upper - 1):
+            inside = (counts > 0) & (np.abs(t - times[np.clip(edge, 0, len(times) - 1)]) >= tolerance)
+            counts = counts - inside
+        counts = np.maximum(counts, 0)
+
+        if not return_nearest:
+            return counts if t.ndim else int(counts)
+
+        # The nearest blink is one of the two neighbours of the insertion point
+        right = np.clip(np.searchsorted(times, t), 0, len(times) - 1)
+        left = np.clip(right - 1, 0, len(times) - 1)
+        left_closer = np.abs(t - times[left]) <= np.abs(times[right] - t)
+        nearest = np.where(left_closer, left, right)
+        distance = np.abs(t - times[nearest])
+
+        if not t.ndim:
+            return int(counts), int(nearest), float(distance)
+        return counts, nearest, distance
+
+    def quasiperiodic_modulation(self, t, phi_1=None, phi_2=None, out=None, dtype=None,
+                                 chunk_size=1 << 18):
+        """
+        Quasiperiodic modulation with golden ratio incommensurability
+        ω(t) = ω_1 cos(2π φ_1 t) + ω_2 cos(2π φ_2 t)
+        where φ_1/φ_2 = φ (golden ratio)
+
+        The grid is processed in chunks with two reusable scratch buffers,
+        so transient memory is O(chunk_size) however large t is. Arrays of
+        frequencies are broadcast against each other and every
+        (phi_1, phi_2) pair is evaluated during the same pass over t.
+
+        Args:
+            t: Time grid (any shape, may be a memmap)
+            phi_1: Frequency or array of frequencies (default 1)
+            phi_2: Second frequency or array (default phi_1 / golden ratio)
+            out: Optional array or memmap of shape phi.shape + t.shape to fill
+            dtype: Output dtype when out is not given (default float64);
+                phases are always computed in float64
+            chunk_size: Grid points evaluated per pass
+
+        Returns:
+            Modulation with shape t.shape for scalar frequencies, otherwise
+            phi.shape + t.shape; out itself when supplied
+        """
+        phi_golden = (1 + np.sqrt(5)) / 2
+
+        if phi_1 is None:
+            phi_1 = 1.0
+        if phi_2 is None:
+            phi_2 = np.asarray(phi_1) / phi_golden
+        phi_1, phi_2 = np.broadcast_arrays(np.asarray(phi_1, dtype=float),
+                                           np.asarray(phi_2, dtype=float))
+
+        t = np.asanyarray(t)
+        shape = phi_1.shape + t.shape
+        if out is None:
+            out = np.empty(shape, dtype=np.float64 if dtype is None else dtype)
+        elif out.shape != shape or not out.flags.c_contiguous:
+            raise ValueError(f"out must be a C-contiguous array of shape {shape}")
+
+        omega_1 = 2 * np.pi * phi_1.ravel()
+        omega_2 = 2 * np.pi * phi_2.ravel()
+        grid = t.reshape(-1)
+        rows = out.reshape(omega_1.size, grid.size)
+
+        size = min(chunk_size, grid.size)
+        phase = np.empty(size)
+        second = np.empty(size)
+        for start in range(0, grid.size, chunk_size):
+            t_chunk = np.asarray(grid[start:start + chunk_size], dtype=np.float64)
+            n = t_chunk.size
+            for k in range(omega_1.size):
+                np.multiply(t_chunk, omega_1[k], out=phase[:n])
+                np.cos(phase[:n], out=phase[:n])
+                np.multiply(t_chunk, omega_2[k], out=second[:n])
+                np.cos(second[:n], out=second[:n])
+                phase[:n] += second[:n]
+                rows[k, start:start + n] = phase[:n]
+
+        if isinstance(out, np.memmap):
+            out.flush()
+        return out if out.ndim else out[()]
+
+    def eigenvalue_bifurcation_sequence(self):
+        """
+        Eigenvalue crossing sequence corresponding to blink pattern
+
+        Returns:
+            Array of eigenvalues at bifurcation points (modulated by gaps)
+        """
+        gap_min = self.statistics.min
+        gap_max = self.statistics.max
+        # Normalize to [-1, 1] range for eigenvalues
+        eigenvalues = 2 * (self.gaps - gap_min) / (gap_max - gap_min) - 1
+
+        return eigenvalues
+
+    def multiverse_branching_probability(self, blink_index):
+        """
+        Probability of multiverse branching at nth blink
+        Proportional to prime gap size (larger gap = more branches)
+
+        Accepts a single index or an array of indices; indices past the last
+        blink have probability 0.
+        """
+        max_gap = self.statistics.max
+        if np.ndim(blink_index) == 0:
+            if blink_index >= len(self.gaps):
+                return 0
+            return self.gaps[blink_index] / max_gap
+
+        blink_index = np.asarray(blink_index)
+        inside = blink_index < len(self.gaps)
+        gaps = self.gaps[np.where(inside, blink_index, 0)]
+        # Normalize to probability
+        return np.where(inside, gaps / max_gap, 0.0)
+
+    def simulate_branching(self, n_realizations=1000, n_blinks=None, start=0,
+                           n_lineages=0, max_population=10**12, record_every=1,
+                           chunk_size=4096, random_state=None):
+        """
+        Monte Carlo multiverse branching driven by the blink probabilities
+
+        At blink k every existing branch splits in two with probability
+        multiverse_branching_probability(k). Realizations advance together
+        as vectors of branch counts, processed in chunks with independent
+        RNG streams, so memory never depends on the size of the trees:
+        only per-generation summaries and optional sampled lineages are kept.
+
+        Args:
+            n_realizations: Independent branching trees to simulate
+            n_blinks: Blinks to simulate (default: the rest of the pattern)
+            start: Index of the first blink
+            n_lineages: Lineages per realization followed by uniform leaf
+                sampling, recording how many times each one split
+            max_population: Branch count at which a realization saturates
+            record_every: Keep summaries for every k-th generation
+            chunk_size: Realizations simulated at once
+            random_state: Seed for the SeedSequence spawning chunk streams
+
+        Returns:
+            Dictionary with recorded "blinks" and per-generation population
+            "mean", "std" and "max"; "final" branch counts per realization;
+            and "lineage_splits" of shape (n_realizations, n_lineages)
+        """
+        if n_blinks is None:
+            n_blinks = max(len(self.gaps) - start, 0)
+        probabilities = self.multiverse_branching_probability(np.arange(start, start + n_blinks))
+        recorded = np.arange(record_every - 1, n_blinks, record_every)
+
+        total = np.zeros(recorded.size)
+        total_sq = np.zeros(recorded.size)
+        largest = np.zeros(recorded.size, dtype=np.int64)
+        final = np.empty(n_realizations, dtype=np.int64)
+        lineage_splits = np.zeros((n_realizations, n_lineages), dtype=np.int64)
+
+        chunk_starts = range(0, n_realizations, chunk_size)
+        streams = np.random.SeedSequence(random_state).spawn(len(chunk_starts))
+        for first, stream in zip(chunk_starts, streams):
+            rng = np.random.default_rng(stream)
+            rows = slice(first, min(first + chunk_size, n_realizations))
+            population = np.ones(rows.stop - rows.start, dtype=np.int64)
+            splits = lineage_splits[rows]
+
+            slot = 0
+            for k, p in enumerate(probabilities):
+                splitting = rng.binomial(population, p)
+                if n_lineages:
+                    # A uniformly chosen new leaf descends from a splitting branch
+                    # with probability 2b / (N + b)
+                    through = 2 * splitting / (population + splitting)
+                    splits += rng.random(splits.shape) < through[:, None]
+                population = np.minimum(population + splitting, max_population)
+
+                if slot < recorded.size and recorded[slot] == k:
+                    total[slot] += np.sum(population, dtype=np.float64)
+                    total_sq[slot] += np.sum(population.astype(np.float64)**2)
+                    largest[slot] = max(largest[slot], population.max())
+                    slot += 1
+
+            final[rows] = population
+
+        mean = total / n_realizations
+        return {
+            "blinks": start + recorded,
+            "mean": mean,
+            "std": np.sqrt(np.maximum(total_sq / n_realizations - mean**2, 0)),
+            "max": largest,
+            "final": final,
+            "lineage_splits": lineage_splits,
+        }
+
+    def information_content_blink(self):
+        """
+        Shannon entropy of blink pattern (information content)
+        """
+        return self.statistics.entropy()
+
+    def fractal_dimension(self, n_scales=20, method="modulo", n_bootstrap=0, confidence=0.95,
+                          workers=None, random_state=None, max_points=10**6,
+                          chunk_size=1 << 20):
+        """
+        Estimate fractal dimension of prime gap distribution
+
+        Args:
+            n_scales: Number of logarithmically spaced scales in the fit
+            method: "modulo" (original gap-modulo count), "box" (box counting
+                of the blink positions) or "correlation" (Grassberger-Procaccia
+                on at most max_points blink positions)
+            n_bootstrap: Bootstrap replicates for a confidence interval
+            confidence: Coverage of the percentile interval
+            workers: Threads evaluating bootstrap replicates (-1 for all cores)
+            random_state: Seed or np.random.Generator for subsampling/bootstrap
+            max_points: Subsample size for the correlation dimension
+            chunk_size: Elements processed per vectorized pass
+
+        Returns:
+            Fractal dimension, or (dimension, (low, high)) with n_bootstrap > 0
+        """
+        gaps = self.gaps
+        integer_gaps = np.issubdtype(gaps.dtype, np.integer)
+        seed = np.random.SeedSequence(random_state if not isinstance(random_state, np.random.Generator)
+                                      else random_state.integers(2**63))
+
+        def estimate(sample, histogram, rng):
+            if method == "modulo":
+                if histogram is None:
+                    return _modulo_dimension(sample, np.ones(sample.size), n_scales, chunk_size)
+                values = np.flatnonzero(histogram)
+                return _modulo_dimension(values, histogram[values].astype(float), n_scales, chunk_size)
+            if method == "box":
+                return _box_dimension(sample, n_scales, chunk_size)
+            if method == "correlation":
+                return _correlation_dimension(sample, n_scales, max_points, rng, chunk_size)
+            raise ValueError(f"Unknown fractal dimension method: {method}")
+
+        histogram = self.statistics.histogram if integer_gaps else None
+        base_seed, *replicate_seeds = seed.spawn(n_bootstrap + 1)
+        fractal_dim = estimate(gaps, histogram, np.random.default_rng(base_seed))
+        if n_bootstrap <= 0:
+            return fractal_dim
+
+        def replicate(replicate_seed):
+            rng = np.random.default_rng(replicate_seed)
+            if method == "modulo" and histogram is not None:
+                # Resampling gaps i.i.d. only redistributes the histogram
+                resampled = rng.multinomial(gaps.size, histogram / gaps.size)
+                return estimate(None, resampled, rng)
+            return estimate(_block_resample(gaps, rng), None, rng)
+
+        with ThreadPoolExecutor(max_workers=resolve_workers(workers)) as executor:
+            replicates = np.array(list(executor.map(replicate, replicate_seeds)))
+
+        tail = 100 * (1 - confidence) / 2
+        low, high = np.percentile(replicates, [tail, 100 - tail])
+        return fractal_dim, (low, high)
@@ -1,27 +1,262 @@
 """Data I/O utilities"""
 
 import numpy as np
-
 import json
+import os
+import struct
+
+from .sieve import iter_primes, nth_prime_upper_bound
+from .zeta import zeta_zeros
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
 
 class PrimeDatabase:
+    """
+    Persistent prime/gap cache shared between processes through np.memmap
 
-@staticmethod
+    Primes after 3 are stored as one byte per gap holding gap/2. Gaps too
+    large for a byte are written as 0 and kept in a sidecar escape table
+    of (index, gap) pairs. The cache grows by sieving only past the last
+    stored prime, and every reader maps the same pages.
 
-def load_from_file(filename):
+    Args:
+        path: Cache file, created on first use
+    """
 
-with open(filename) as f:
+    MAGIC = b"WHPRIME1"
+    HEADER = struct.Struct("<8sQQQ")  # magic, gaps stored, last prime, escapes
+    ESCAPE = 0
+    ESCAPE_ROW = 16  # bytes per (index, gap) uint64 pair
+    DECODE_CHUNK = 1 << 22
 
-return json.load(f)
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        self.escape_path = self.path + ".esc"
+        if not os.path.exists(self.path):
+            self._create()
 
-class CMBDataLoader:
+    @staticmethod
+    def load_from_file(filename):
+        with open(filename) as f:
+            return json.load(f)
+
+    def _create(self):
+        try:
+            with open(self.path, "xb") as f:
+                f.write(self.HEADER.pack(self.MAGIC, 0, 3, 0))
+            open(self.escape_path, "wb").close()
+        except FileExistsError:
+            pass
+
+    def _read_header(self):
+        with open(self.path, "rb") as f:
+            magic, n_gaps, last_prime, n_escapes = self.HEADER.unpack(f.read(self.HEADER.size))
+        if magic != self.MAGIC:
+            raise ValueError(f"{self.path} is not a prime cache")
+        return n_gaps, last_prime, n_escapes
+
+    def __len__(self):
+        """Number of primes stored (2 and 3 are always present)"""
+        return self._read_header()[0] + 2
+
+    @property
+    def last_prime(self):
+        return self._read_header()[1]
+
+    def half_gaps(self):
+        """Read-only memory map of the stored half-gap bytes"""
+        n_gaps = self._read_header()[0]
+        if n_gaps == 0:
+            return np.empty(0, dtype=np.uint8)
+        return np.memmap(self.path, dtype=np.uint8, mode="r",
+                         offset=self.HEADER.size, shape=(n_gaps,))
+
+    def _escapes(self):
+        n_escapes = self._read_header()[2]
+        if n_escapes == 0:
+            return np.empty((0, 2), dtype=np.uint64)
+        return np.memmap(self.escape_path, dtype=np.uint64, mode="r", shape=(n_escapes, 2))
+
+    def extend_to(self, limit):
+        """
+        Grow the cache so that it holds every prime up to limit
+
+        Only the range past the last stored prime is sieved. Growth is
+        serialized with an exclusive file lock where available.
+        """
+        escape_fd = os.open(self.escape_path, os.O_RDWR | os.O_CREAT, 0o644)
+        with open(self.path, "r+b") as f, os.fdopen(escape_fd, "r+b") as esc:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                n_gaps, last_prime, n_escapes = self._read_header()
+                if limit <= last_prime:
+                    return
+
+                # Rows past the published counts are left over from an
+                # interrupted growth; overwrite them like the gap bytes
+                f.seek(self.HEADER.size + n_gaps)
+                esc.seek(self.ESCAPE_ROW * n_escapes)
+                esc.truncate()
+                for primes in iter_primes(last_prime + 1, limit + 1):
+                    if primes.size == 0:
+                        continue
+                    half = np.diff(primes, prepend=last_prime) // 2
+                    last_prime = int(primes[-1])
+
+                    large = np.flatnonzero(half > 255)
+                    if large.size:
+                        entries = np.column_stack((large + n_gaps, 2 * half[large]))
+                        esc.write(entries.astype(np.uint64).tobytes())
+                        half[large] = self.ESCAPE
+                        n_escapes += large.size
+
+                    f.write(half.astype(np.uint8).tobytes())
+                    n_gaps += half.size
+
+                # Publish the new length only after the data is on disk
+                f.flush()
+                esc.flush()
+                f.seek(0)
+                f.write(self.HEADER.pack(self.MAGIC, n_gaps, last_prime, n_escapes))
+                f.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
 
-@staticmethod
+    def ensure_count(self, n_primes):
+        """Grow the cache until it holds at least n_primes primes"""
+        if len(self) < n_primes:
+            self.extend_to(nth_prime_upper_bound(n_primes))
 
-def generate_mock_cmb(ell_max=2000):
+    def _decode(self, start, stop):
+        """Full gap values for stored gaps start..stop (after prime 3)"""
+        gaps = 2 * np.asarray(self.half_gaps()[start:stop], dtype=np.int32)
+        escapes = self._escapes()
+        if escapes.size:
+            index = escapes[:, 0].astype(np.int64)
+            keep = (index >= start) & (index < stop)
+            gaps[index[keep] - start] = escapes[keep, 1]
+        return gaps
 
-ell = np.arange(2, ell_max + 1)
+    def gaps(self, n_primes=None):
+        """Gaps between the first n_primes cached primes (default: all)"""
+        if n_primes is None:
+            n_primes = len(self)
+        self.ensure_count(n_primes)
+        if n_primes < 2:
+            return np.empty(0, dtype=np.int32)
+        return np.concatenate(([1], self._decode(0, n_primes - 2))).astype(np.int32)
 
-power = 5000 * np.exp(-(ell - 220)**2 / 10000) + 1000 * np.exp(-(ell - 550)**2 / 22500)
+    def primes(self, n_primes=None):
+        """First n_primes primes (default: all cached primes)"""
+        if n_primes == 0:
+            return np.empty(0, dtype=np.int64)
+        gaps = self.gaps(n_primes)
+        return np.concatenate(([2], 2 + np.cumsum(gaps, dtype=np.int64)))
 
-return ell, power
\ No newline at end of file
+    def primes_up_to(self, limit):
+        """Every prime up to and including limit"""
+        if limit < 3:
+            return np.array([2] if limit >= 2 else [], dtype=np.int64)
+        self.extend_to(limit)
+        n_gaps = self._read_header()[0]
+
+        # Decode in chunks and stop at the first chunk that passes the limit
+        stop = 0
+        value = 3
+        while stop < n_gaps and value <= limit:
+            chunk = self._decode(stop, min(stop + self.DECODE_CHUNK, n_gaps))
+            ends = value + np.cumsum(chunk, dtype=np.int64)
+            stop += int(np.searchsorted(ends, limit, side='right'))
+            value = int(ends[-1])
+
+        return self.primes(stop + 2)
+
+
+class ZetaZeroTable:
+    """
+    Persistent table of zeta zero ordinates shared through np.memmap
+
+    Zeros are stored as float64 in increasing order after a small header.
+    The table grows by computing only the zeros past the last stored one,
+    so the expensive batch search runs once per height range.
+
+    Args:
+        path: Table file, created on first use
+    """
+
+    MAGIC = b"WHZETA01"
+    HEADER = struct.Struct("<8sQ")  # magic, zeros stored
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        if not os.path.exists(self.path):
+            try:
+                with open(self.path, "xb") as f:
+                    f.write(self.HEADER.pack(self.MAGIC, 0))
+            except FileExistsError:
+                pass
+
+    def _read_header(self):
+        with open(self.path, "rb") as f:
+            magic, count = self.HEADER.unpack(f.read(self.HEADER.size))
+        if magic != self.MAGIC:
+            raise ValueError(f"{self.path} is not a zeta zero table")
+        return count
+
+    def __len__(self):
+        """Number of zeros stored"""
+        return self._read_header()
+
+    def _stored(self, count):
+        if count == 0:
+            return np.empty(0, dtype=np.float64)
+        return np.memmap(self.path, dtype=np.float64, mode="r",
+                         offset=self.HEADER.size, shape=(count,))
+
+    def ensure_count(self, n_zeros, batch=1 << 16):
+        """
+        Grow the table until it holds at least the first n_zeros zeros
+
+        New zeros are computed in batches after the last stored one and the
+        count is published only once a batch is on disk. Growth is
+        serialized with an exclusive file lock where available.
+        """
+        with open(self.path, "r+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                count = self._read_header()
+                while count < n_zeros:
+                    after = float(self._stored(count)[-1]) if count else 0.0
+                    new = zeta_zeros(min(n_zeros - count, batch), after=after)
+                    f.seek(self.HEADER.size + 8 * count)
+                    f.write(new.astype(np.float64).tobytes())
+                    f.flush()
+                    count += new.size
+                    f.seek(0)
+                    f.write(self.HEADER.pack(self.MAGIC, count))
+                    f.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def zeros(self, n_zeros=None):
+        """First n_zeros zero ordinates (default: all stored zeros)"""
+        if n_zeros is None:
+            n_zeros = len(self)
+        self.ensure_count(n_zeros)
+        return self._stored(n_zeros)
+
+
+class CMBDataLoader:
+    @staticmethod
+    def generate_mock_cmb(ell_max=2000):
+        ell = np.arange(2, ell_max + 1)
+        power = 5000 * np.exp(-(ell - 220)**2 / 10000) + 1000 * np.exp(-(ell - 550)**2 / 22500)
+        return ell, power
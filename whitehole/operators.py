@@ -1,266 +1,658 @@
 """
-
 Linguistic operators: Subject, Verb, Object in quantum framework
-
 """
 
+from collections import OrderedDict
+from functools import cached_property
+
 import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import eig, eigh, expm, schur
+from scipy.sparse.linalg import LinearOperator, expm_multiply
+from scipy.sparse.linalg import norm as sparse_norm
+
+# Propagators kept per LinguisticOperators instance, least recently used first out
+PROPAGATOR_CACHE_SIZE = 16
+
+# Eigenvector matrices worse conditioned than this fall back to a Schur form
+EIGENVECTOR_CONDITION_LIMIT = 1e8
+
+
+def _stored_rows(time_steps, keep_every):
+    """Rows of a trajectory storing every keep_every-th of time_steps steps"""
+    if keep_every < 1 or time_steps % keep_every:
+        raise ValueError(f"time_steps ({time_steps}) must be a multiple of keep_every ({keep_every})")
+    return time_steps // keep_every + 1
+
+
+def operator_norm(operator):
+    """Frobenius norm of a dense or scipy.sparse operator"""
+    if sp.issparse(operator):
+        return sparse_norm(operator)
+    return np.linalg.norm(operator)
+
+
+def is_hermitian(operator):
+    """Whether a dense or scipy.sparse operator equals its conjugate transpose"""
+    if sp.issparse(operator):
+        difference = abs(operator - operator.conj().T)
+        return difference.nnz == 0 or difference.max() <= 1e-8
+    return np.allclose(operator, operator.conj().T)
+
+
+class SpectralPropagator:
+    """
+    exp(-i H t) at arbitrary times from one decomposition of H
+
+    Hermitian H uses eigh, so exp(-i H t) = V diag(exp(-i λ t)) V^H.
+    Non-Hermitian H is diagonalized with eig when its eigenvectors are well
+    conditioned; otherwise H = Z T Z^H (complex Schur) and the triangular
+    exponential is taken per time.
+
+    Args:
+        hamiltonian: Square matrix H
+    """
+
+    def __init__(self, hamiltonian):
+        H = np.asarray(hamiltonian, dtype=np.complex128)
+        self.hermitian = np.allclose(H, H.conj().T)
+        self.schur = None
+
+        if self.hermitian:
+            self.eigenvalues, self.eigenvectors = eigh(H)
+            self.inverse = self.eigenvectors.conj().T
+            return
+
+        eigenvalues, eigenvectors = eig(H)
+        if np.linalg.cond(eigenvectors) < EIGENVECTOR_CONDITION_LIMIT:
+            self.eigenvalues, self.eigenvectors = eigenvalues, eigenvectors
+            self.inverse = np.linalg.inv(eigenvectors)
+        else:
+            self.schur = schur(H, output='complex')
+
+    def evolve(self, initial_states, times):
+        """
+        States exp(-i H t) ψ0 for every time
+
+        Args:
+            initial_states: One state (D,) or a matrix of states (n_states, D)
+            times: Array of times, in any order and spacing
+
+        Returns:
+            Array of shape times.shape + initial_states.shape
+        """
+        psi0 = np.asarray(initial_states, dtype=np.complex128)
+        times = np.asarray(times, dtype=float)
+
+        if self.schur is not None:
+            T, Z = self.schur
+            flat = np.stack([Z @ expm(-1j * T * t) @ Z.conj().T for t in times.ravel()])
+            return np.einsum('tij,...j->t...i', flat, psi0).reshape(times.shape + psi0.shape)
+
+        coefficients = psi0 @ self.inverse.T
+        phases = np.exp(-1j * np.multiply.outer(times, self.eigenvalues))
+        if psi0.ndim == 2:
+            phases = phases[..., None, :]
+        return (phases * coefficients) @ self.eigenvectors.T
+
+    @staticmethod
+    def expectation(operator, states):
+        """⟨ψ|A|ψ⟩ over the last axis of states, real for Hermitian A"""
+        # The spectral path is dense already; sparse and matrix-free A follow it
+        if sp.issparse(operator):
+            operator = operator.toarray()
+        elif isinstance(operator, LinearOperator):
+            operator = operator @ np.eye(operator.shape[1])
+        operator = np.asarray(operator)
+        values = np.sum(states.conj() * (states @ operator.T), axis=-1)
+        return values.real if np.allclose(operator, operator.conj().T) else values
+
+    def survival_probability(self, initial_states, times):
+        """|⟨ψ0|ψ(t)⟩|² for every time (and initial state)"""
+        psi0 = np.asarray(initial_states, dtype=np.complex128)
+        states = self.evolve(psi0, times)
+        return np.abs(np.sum(psi0.conj() * states, axis=-1))**2
 
-from scipy.linalg import expm
 
 class LinguisticOperators:
-
-"""
-
-Operators mapping linguistic structure to quantum transitions
-
-"""
-
-def __init__(self, dimension=2):
-
-"""
-
-Initialize linguistic operators in Hilbert space of given dimension
-
-"""
-
-self.dim = dimension
-
-self.I = np.eye(dimension)
-
-# Pauli matrices for 2D case
-
-if dimension == 2:
-
-self.sigma_x = np.array([[0, 1], [1, 0]])
-
-self.sigma_y = np.array([[0, -1j], [1j, 0]])
-
-self.sigma_z = np.array([[1, 0], [0, -1]])
-
-def subject_operator(self):
-
-"""
-
-Subject operator S (agency): |Object⟩ → |Subject⟩
-
-Represents initiator/agent of action
-
-"""
-
-if self.dim == 2:
-
-return self.sigma_x # Flip between states
-
-else:
-
-# For higher dimensions: permutation that prioritizes first state
-
-S = np.zeros((self.dim, self.dim))
-
-S[-1, 0] = 1 # Cyclic shift
-
-for i in range(self.dim - 1):
-
-S[i, i+1] = 1
-
-return S
-
-def verb_operator(self):
-
-"""
-
-Verb operator V (action/transference): |Subject⟩ → |Object⟩
-
-Represents transformation between states
-
-"""
-
-if self.dim == 2:
-
-return self.sigma_y # Rotation in phase space
-
-else:
-
-# For higher dimensions: operator representing evolution
-
-V = np.diag(np.exp(2j * np.pi * np.arange(self.dim) / self.dim))
-
-return V
-
-def object_operator(self):
-
-"""
-
-Object operator O (recipient of action): |Verb⟩ → |Object⟩
-
-Represents patient/result of action
-
-"""
-
-if self.dim == 2:
-
-return self.sigma_z # Measurement/diagonalization
-
-else:
-
-# For higher dimensions: projection operator
-
-O = np.zeros((self.dim, self.dim))
-
-O[self.dim-1, self.dim-1] = 1 # Project to final state
-
-return O
-
-def measurement_eye_operator(self):
-
-"""
-
-Eye operator E: measurement/observation interface
-
-|Ψ_superposition⟩ → |Classical outcome⟩
-"""
-
-if self.dim == 2:
-
-# Measurement operator that couples to subject-verb-object sequence
-
-E = np.array([[1, 0.5], [0.5, 1]]) / 1.5
-
-return E
-
-else:
-
-# For higher dimensions: coupling matrix
-
-E = np.eye(self.dim) + 0.5 * np.ones((self.dim, self.dim))
-
-return E / (self.dim + 0.5 * self.dim**2)
-
-def linguistic_hamiltonian(self, coupling_strength=1.0):
-
-"""
-
-Hamiltonian encoding linguistic interaction:
-
-H_ling = g(S⊗V + V⊗O + h.c.)
-
-Args:
-
-coupling_strength: Coupling constant g
-
-"""
-
-S = self.subject_operator()
-
-V = self.verb_operator()
-
-O = self.object_operator()
-
-# Construct tensor product interactions
-
-if self.dim == 2:
-
-H_SV = np.kron(S, V)
-
-H_VO = np.kron(V, O)
-
-H_ling = coupling_strength * (H_SV + H_VO + H_SV.conj().T + H_VO.conj().T)
-
-else:
-
-# For general dimension, use direct sum approximation
-
-H_ling = coupling_strength * (S + V + O)
-
-return H_ling
-
-def subject_verb_object_sequence(self, initial_state, time_steps, dt=0.01):
-
-"""
-
-Evolve quantum state through subject → verb → object sequence
-
-Returns:
-
-List of states at each time step
-
-"""
-
-H = self.linguistic_hamiltonian()
-
-states = [initial_state.copy()]
-
-for _ in range(time_steps):
-
-# Time evolution: |ψ(t+dt)⟩ = exp(-iH dt/ℏ)|ψ(t)⟩
-
-U = expm(-1j * H * dt)
-
-initial_state = U @ initial_state
-
-states.append(initial_state.copy())
-
-return states
-
-def commutation_relation(self):
-
-"""
-
-Linguistic uncertainty relation: [V, S] = iℏ_L I
-
-Returns:
-
-[V, S] (should be non-zero for non-commuting operators)
-
-"""
-
-S = self.subject_operator()
-
-V = self.verb_operator()
-
-commutator = V @ S - S @ V
-
-return commutator
-
-def verify_linguistic_structure(self):
-
-"""
-
-Verify that linguistic operators satisfy expected commutation relations
-
-Returns:
-
-Dictionary of verification results
-
-"""
-
-S = self.subject_operator()
-
-V = self.verb_operator()
-
-O = self.object_operator()
-
-comm_SV = V @ S - S @ V
-
-comm_VO = O @ V - V @ O
-
-return {
-
-"S_norm": np.linalg.norm(S),
-
-"V_norm": np.linalg.norm(V),
-
-"O_norm": np.linalg.norm(O),
-
-"[V,S]_norm": np.linalg.norm(comm_SV),
-
-"[O,V]_norm": np.linalg.norm(comm_VO),
-
-"S_hermitian": np.allclose(S, S.conj().T),
-
-"V_hermitian": np.allclose(V, V.conj().T),
-
-"O_hermitian": np.allclose(O, O.conj().T)
-
-}
\ No newline at end of file
+    """
+    Operators mapping linguistic structure to quantum transitions
+    """
+
+    def __init__(self, dimension=2, sparse=False):
+        """
+        Initialize linguistic operators in Hilbert space of given dimension
+
+        Args:
+            dimension: Hilbert space dimension
+            sparse: Build S, V, O and H as scipy.sparse CSR matrices (and E
+                as a LinearOperator) and evolve with expm_multiply, so the
+                dimension can reach millions
+        """
+        self.dim = dimension
+        self.sparse = sparse
+        self.I = sp.identity(dimension, format='csr') if sparse else np.eye(dimension)
+        self._propagators = OrderedDict()
+
+        # Pauli matrices for 2D case
+        if dimension == 2:
+            self.sigma_x = self._matrix(np.array([[0, 1], [1, 0]]))
+            self.sigma_y = self._matrix(np.array([[0, -1j], [1j, 0]]))
+            self.sigma_z = self._matrix(np.array([[1, 0], [0, -1]]))
+
+    def _matrix(self, dense):
+        """A small dense matrix in the representation of this instance"""
+        return sp.csr_matrix(dense) if self.sparse else dense
+
+    def subject_operator(self):
+        """
+        Subject operator S (agency): |Object⟩ → |Subject⟩
+        Represents initiator/agent of action
+        """
+        if self.dim == 2:
+            return self.sigma_x  # Flip between states
+        elif self.sparse:
+            # Cyclic shift: S[i, i+1] = 1 and S[-1, 0] = 1
+            rows = np.arange(self.dim)
+            return sp.csr_matrix((np.ones(self.dim), (rows, (rows + 1) % self.dim)),
+                                     shape=(self.dim, self.dim))
+        else:
+            # For higher dimensions: permutation that prioritizes first state
+            S = np.zeros((self.dim, self.dim))
+            S[-1, 0] = 1  # Cyclic shift
+            for i in range(self.dim - 1):
+                S[i, i+1] = 1
+            return S
+
+    def verb_operator(self):
+        """
+        Verb operator V (action/transference): |Subject⟩ → |Object⟩
+        Represents transformation between states
+        """
+        if self.dim == 2:
+            return self.sigma_y  # Rotation in phase space
+        elif self.sparse:
+            return sp.diags(np.exp(2j * np.pi * np.arange(self.dim) / self.dim), format='csr')
+        else:
+            # For higher dimensions: operator representing evolution
+            V = np.diag(np.exp(2j * np.pi * np.arange(self.dim) / self.dim))
+            return V
+
+    def object_operator(self):
+        """
+        Object operator O (recipient of action): |Verb⟩ → |Object⟩
+        Represents patient/result of action
+        """
+        if self.dim == 2:
+            return self.sigma_z  # Measurement/diagonalization
+        elif self.sparse:
+            return sp.csr_matrix(([1.0], ([self.dim - 1], [self.dim - 1])), shape=(self.dim, self.dim))
+        else:
+            # For higher dimensions: projection operator
+            O = np.zeros((self.dim, self.dim))
+            O[self.dim-1, self.dim-1] = 1  # Project to final state
+            return O
+
+    def measurement_eye_operator(self):
+        """
+        Eye operator E: measurement/observation interface
+        |Ψ_superposition⟩ → |Classical outcome⟩
+        """
+        if self.dim == 2:
+            # Measurement operator that couples to subject-verb-object sequence
+            E = np.array([[1, 0.5], [0.5, 1]]) / 1.5
+            return self._matrix(E)
+        elif self.sparse:
+            # (I + 0.5 * ones) / norm is dense but rank-one: apply it matrix-free
+            scale = 1 / (self.dim + 0.5 * self.dim**2)
+
+            def apply(x):
+                x = np.asarray(x)
+                return (x + 0.5 * np.sum(x, axis=0)) * scale
+
+            return LinearOperator((self.dim, self.dim), matvec=apply, matmat=apply,
+                                  rmatvec=apply, rmatmat=apply, dtype=np.float64)
+        else:
+            # For higher dimensions: coupling matrix
+            E = np.eye(self.dim) + 0.5 * np.ones((self.dim, self.dim))
+            return E / (self.dim + 0.5 * self.dim**2)
+
+    def linguistic_hamiltonian(self, coupling_strength=1.0):
+        """
+        Hamiltonian encoding linguistic interaction:
+        H_ling = g(S⊗V + V⊗O + h.c.)
+
+        Args:
+            coupling_strength: Coupling constant g
+        """
+        S = self.subject_operator()
+        V = self.verb_operator()
+        O = self.object_operator()
+
+        # Construct tensor product interactions
+        kron = (lambda a, b: sp.kron(a, b, format='csr')) if self.sparse else np.kron
+        if self.dim == 2:
+            H_SV = kron(S, V)
+            H_VO = kron(V, O)
+            H_ling = coupling_strength * (H_SV + H_VO + H_SV.conj().T + H_VO.conj().T)
+        else:
+            # For general dimension, use direct sum approximation
+            H_ling = coupling_strength * (S + V + O)
+
+        return H_ling.tocsr() if self.sparse else H_ling
+
+    def propagator(self, coupling_strength=1.0, dt=0.01):
+        """
+        Time-step propagator exp(-i H dt) for the linguistic Hamiltonian
+
+        Cached per (coupling_strength, dt) in a small LRU, so repeated runs
+        with the same parameters never call expm again.
+        """
+        if self.sparse:
+            raise ValueError("Sparse operators evolve with expm_multiply; no dense propagator is formed")
+        key = (float(coupling_strength), float(dt))
+        U = self._propagators.get(key)
+        if U is None:
+            U = expm(-1j * self.linguistic_hamiltonian(coupling_strength) * dt)
+            U.flags.writeable = False
+            self._propagators[key] = U
+            if len(self._propagators) > PROPAGATOR_CACHE_SIZE:
+                self._propagators.popitem(last=False)
+        else:
+            self._propagators.move_to_end(key)
+        return U
+
+    def subject_verb_object_sequence(self, initial_state, time_steps, dt=0.01,
+                                     coupling_strength=1.0, keep_every=1):
+        """
+        Evolve quantum state through subject → verb → object sequence
+
+        The propagator is computed once (and cached); with keep_every=k the
+        state advances by U**k between stored rows, so skipped steps cost
+        nothing.
+
+        Args:
+            initial_state: State vector (length 4 for dimension 2, else dim)
+            time_steps: Number of dt steps
+            dt: Time step
+            coupling_strength: Coupling constant g of the Hamiltonian
+            keep_every: Store every k-th state (time_steps must be a multiple)
+
+        Returns:
+            Complex array of states at steps 0, k, 2k, ..., one per row
+        """
+        n_rows = _stored_rows(time_steps, keep_every)
+        if self.sparse:
+            return self._krylov_trajectory(initial_state, time_steps, dt, coupling_strength, keep_every)
+
+        U = self.propagator(coupling_strength, dt)
+        if keep_every > 1:
+            U = np.linalg.matrix_power(U, keep_every)
+
+        states = np.empty((n_rows, U.shape[0]), dtype=np.complex128)
+        states[0] = initial_state
+        for step in range(1, states.shape[0]):
+            # Time evolution: |ψ(t+dt)⟩ = exp(-iH dt/ℏ)|ψ(t)⟩
+            np.matmul(U, states[step - 1], out=states[step])
+
+        return states
+
+    def _krylov_trajectory(self, states, time_steps, dt, coupling_strength, keep_every):
+        """
+        States at steps 0, k, 2k, ... from the action of exp(-i H t) alone
+
+        expm_multiply evaluates the uniformly spaced times in one call and
+        never forms the exponential, so only sparse products with H occur.
+        Column states (D, n) give an array of shape (rows, D, n).
+        """
+        H = self.linguistic_hamiltonian(coupling_strength)
+        n_rows = _stored_rows(time_steps, keep_every)
+        states = np.asarray(states, dtype=np.complex128)
+        if n_rows == 1:
+            return states[None].copy()
+        return expm_multiply(-1j * H, states, start=0, stop=(n_rows - 1) * keep_every * dt,
+                             num=n_rows, endpoint=True)
+
+    def evolve_batch(self, initial_states, time_steps, dt=0.01, couplings=1.0, keep_every=1,
+                     out=None, reducer=None):
+        """
+        Evolve many initial states under many coupling strengths together
+
+        Propagators for every coupling are stacked and all states advance
+        with one batched matrix product per stored row, instead of a loop
+        over (state, coupling) pairs.
+
+        Args:
+            initial_states: (n_states, D) matrix of initial states, or one state
+            time_steps: Number of dt steps
+            dt: Time step
+            couplings: Coupling strength or vector of coupling strengths
+            keep_every: Store every k-th state (time_steps must be a multiple)
+            out: Optional array or memmap of shape (n_couplings, n_states, rows, D)
+            reducer: Optional callable applied to each stored (n_couplings,
+                n_states, D) block instead of keeping the trajectory
+
+        Returns:
+            (n_couplings, n_states, rows, D) complex array with rows =
+            time_steps // keep_every + 1, or the stacked reducer outputs
+        """
+        states = np.array(np.atleast_2d(initial_states), dtype=np.complex128)
+        couplings = np.atleast_1d(np.asarray(couplings, dtype=float))
+        n_rows = _stored_rows(time_steps, keep_every)
+
+        if self.sparse:
+            # -i H(g) t for one stored row; expm_multiply acts on state columns
+            generators = [-1j * keep_every * dt * self.linguistic_hamiltonian(g) for g in couplings]
+        else:
+            # Row-vector states advance as X @ U^T
+            steps = np.stack([np.linalg.matrix_power(self.propagator(g, dt), keep_every).T for g in couplings])
+        current = np.broadcast_to(states, (couplings.size,) + states.shape).copy()
+
+        shape = (couplings.size, states.shape[0], n_rows, states.shape[1])
+        if reducer is None and out is None:
+            out = np.empty(shape, dtype=np.complex128)
+        elif out is not None and out.shape != shape:
+            raise ValueError(f"out must have shape {shape}")
+
+        reduced = []
+        for row in range(n_rows):
+            if row and self.sparse:
+                # One Krylov step per row keeps memory at a single block of states
+                for block, A in zip(current, generators):
+                    block[:] = expm_multiply(A, block.T).T
+            elif row:
+                current = np.matmul(current, steps)
+            if out is not None:
+                out[:, :, row] = current
+            if reducer is not None:
+                reduced.append(reducer(current))
+
+        if reducer is not None:
+            return np.stack(reduced)
+        if isinstance(out, np.memmap):
+            out.flush()
+        return out
+
+    @cached_property
+    def spectral_propagator(self):
+        """
+        SpectralPropagator of the unit-coupling Hamiltonian
+
+        H(g) = g H(1), so one decomposition serves every coupling strength
+        with times scaled by g.
+        """
+        H = self.linguistic_hamiltonian(1.0)
+        return SpectralPropagator(H.toarray() if self.sparse else H)
+
+    def lifted_operator(self, name, site=0):
+        """
+        S, V, O or E acting on the Hamiltonian's state space
+
+        For dimension 2 the Hamiltonian lives on the two-site kron space, so
+        the single-site operator is lifted to A⊗I (site 0) or I⊗A (site 1).
+        """
+        operator = {
+            "S": self.subject_operator,
+            "V": self.verb_operator,
+            "O": self.object_operator,
+            "E": self.measurement_eye_operator,
+        }[name]()
+        if self.dim != 2:
+            return operator
+        kron = (lambda a, b: sp.kron(a, b, format='csr')) if self.sparse else np.kron
+        return kron(operator, self.I) if site == 0 else kron(self.I, operator)
+
+    def evolve_spectral(self, initial_states, times, coupling_strength=1.0):
+        """States at arbitrary times, shape times.shape + initial_states.shape"""
+        times = coupling_strength * np.asarray(times, dtype=float)
+        return self.spectral_propagator.evolve(initial_states, times)
+
+    def expectation_values(self, initial_states, times, coupling_strength=1.0,
+                           observables=("S", "V", "O", "E"), site=0):
+        """
+        Expectation values of S, V, O and E along a spectral evolution
+
+        States are evolved once and every observable is evaluated on the
+        same vectorized batch. States are not renormalized, which matters
+        only for non-Hermitian Hamiltonians.
+
+        Returns:
+            Dictionary mapping each observable name to an array of shape
+            times.shape (+ (n_states,) for a matrix of initial states)
+        """
+        states = self.evolve_spectral(initial_states, times, coupling_strength)
+        return {name: SpectralPropagator.expectation(self.lifted_operator(name, site), states)
+                for name in observables}
+
+    def survival_probability(self, initial_states, times, coupling_strength=1.0):
+        """|⟨ψ0|ψ(t)⟩|² at arbitrary times"""
+        times = coupling_strength * np.asarray(times, dtype=float)
+        return self.spectral_propagator.survival_probability(initial_states, times)
+
+    def chain(self, n_sites, coupling_strength=1.0, periodic=False):
+        """LinguisticChain of n_sites sites with this local dimension"""
+        return LinguisticChain(n_sites, self.dim, coupling_strength, periodic)
+
+    def commutation_relation(self):
+        """
+        Linguistic uncertainty relation: [V, S] = iℏ_L I
+
+        Returns:
+            [V, S] (should be non-zero for non-commuting operators)
+        """
+        S = self.subject_operator()
+        V = self.verb_operator()
+        commutator = V @ S - S @ V
+
+        return commutator
+
+    def verify_linguistic_structure(self):
+        """
+        Verify that linguistic operators satisfy expected commutation relations
+
+        Returns:
+            Dictionary of verification results
+        """
+        S = self.subject_operator()
+        V = self.verb_operator()
+        O = self.object_operator()
+
+        comm_SV = V @ S - S @ V
+        comm_VO = O @ V - V @ O
+
+        return {
+            "S_norm": operator_norm(S),
+            "V_norm": operator_norm(V),
+            "O_norm": operator_norm(O),
+            "[V,S]_norm": operator_norm(comm_SV),
+            "[O,V]_norm": operator_norm(comm_VO),
+            "S_hermitian": is_hermitian(S),
+            "V_hermitian": is_hermitian(V),
+            "O_hermitian": is_hermitian(O)
+        }
+
+
+class LinguisticChain:
+    """
+    Chain of sentence sites with S⊗V and V⊗O couplings between neighbours
+
+    H = g Σ_j (S_j V_{j+1} + V_j O_{j+1} + h.c.), where site 0 is the most
+    significant factor of the Kronecker order, matching np.kron. Bond
+    terms are assembled straight into COO/CSR from the nonzeros of the
+    two-site term, so no intermediate Kronecker product is formed.
+
+    Args:
+        n_sites: Number of sites N
+        dimension: Local dimension of each site (S, V, O as in LinguisticOperators)
+        coupling_strength: Coupling constant g
+        periodic: Couple the last site back to the first
+        chunk_size: Basis states processed together when walking the basis
+    """
+
+    def __init__(self, n_sites, dimension=2, coupling_strength=1.0, periodic=False,
+                 chunk_size=1 << 20):
+        self.n_sites = int(n_sites)
+        self.local_dim = int(dimension)
+        self.coupling = coupling_strength
+        self.periodic = periodic
+        self.chunk_size = int(chunk_size)
+        self.size = self.local_dim**self.n_sites
+
+        ops = LinguisticOperators(dimension, sparse=True)
+        S, V, O = ops.subject_operator(), ops.verb_operator(), ops.object_operator()
+        bond = sp.kron(S, V) + sp.kron(V, O)
+        bond = coupling_strength * (bond + bond.conj().T)
+        # Two-site term as (d², d²) COO with rows (a', b') and columns (a, b)
+        self.bond = sp.coo_matrix(bond)
+        self.bond.sum_duplicates()
+
+        n_bonds = self.n_sites if periodic and self.n_sites > 2 else self.n_sites - 1
+        self.bonds = [(j, (j + 1) % self.n_sites) for j in range(max(n_bonds, 0))]
+        # Weight of site j in a flat index
+        self.strides = self.local_dim ** np.arange(self.n_sites - 1, -1, -1, dtype=np.int64)
+
+    def _digit(self, configs, site):
+        return (configs // self.strides[site]) % self.local_dim
+
+    def _bond_action(self, configs, site_1, site_2):
+        """
+        Nonzero images of basis states under one bond term
+
+        Returns:
+            (source positions in configs, target configs, amplitudes)
+        """
+        d = self.local_dim
+        pair = self._digit(configs, site_1) * d + self._digit(configs, site_2)
+        sources, targets, values = [], [], []
+        for row, col, value in zip(self.bond.row, self.bond.col, self.bond.data):
+            hit = np.flatnonzero(pair == col)
+            shift = (row // d - col // d) * self.strides[site_1] + (row % d - col % d) * self.strides[site_2]
+            sources.append(hit)
+            targets.append(configs[hit] + shift)
+            values.append(np.full(hit.size, value))
+        return np.concatenate(sources), np.concatenate(targets), np.concatenate(values)
+
+    def hamiltonian(self, chunk_size=None):
+        """
+        Full chain Hamiltonian as a CSR matrix
+
+        Basis states are processed in chunks (default self.chunk_size), so
+        temporaries stay bounded apart from the COO entries themselves.
+        """
+        chunk_size = chunk_size or self.chunk_size
+        rows, cols, data = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)], [np.empty(0)]
+        for start in range(0, self.size, chunk_size):
+            configs = np.arange(start, min(start + chunk_size, self.size), dtype=np.int64)
+            for site_1, site_2 in self.bonds:
+                sources, targets, values = self._bond_action(configs, site_1, site_2)
+                rows.append(targets)
+                cols.append(configs[sources])
+                data.append(values)
+
+        coo = sp.coo_matrix((np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+                            shape=(self.size, self.size), dtype=np.complex128)
+        return coo.tocsr()
+
+    def linear_operator(self):
+        """
+        Matrix-free H as a LinearOperator
+
+        States are reshaped to a (d,) * N tensor and each bond contracts
+        the (d, d, d, d) two-site tensor with its pair of site axes, so
+        memory is a few state vectors whatever the chain length.
+        """
+        d, N = self.local_dim, self.n_sites
+        tensor = self.bond.toarray().reshape(d, d, d, d)
+
+        def apply(x):
+            x = np.asarray(x)
+            columns = x.reshape(self.size, -1)
+            state = columns.reshape((d,) * N + (columns.shape[1],))
+            result = np.zeros(state.shape, dtype=np.result_type(state, tensor))
+            for site_1, site_2 in self.bonds:
+                contracted = np.tensordot(tensor, state, axes=([2, 3], [site_1, site_2]))
+                result += np.moveaxis(contracted, [0, 1], [site_1, site_2])
+            return result.reshape(x.shape)
+
+        # H is Hermitian, so the adjoint applies the same contraction
+        return LinearOperator((self.size, self.size), matvec=apply, matmat=apply,
+                              rmatvec=apply, rmatmat=apply, dtype=np.complex128)
+
+    def _translate(self, configs):
+        """Shift every site by one: site i moves to site i + 1 (mod N)"""
+        d = self.local_dim
+        return configs // d + (configs % d) * self.strides[0]
+
+    def _canonical(self, configs):
+        """Smallest translate of each config and the shift l with T^l(rep) = config"""
+        best = configs.copy()
+        best_shift = np.zeros(configs.shape, dtype=np.int64)
+        current = configs
+        for shift in range(1, self.n_sites):
+            current = self._translate(current)
+            better = current < best
+            best[better] = current[better]
+            best_shift[better] = shift
+        return best, (self.n_sites - best_shift) % self.n_sites
+
+    @cached_property
+    def translation_orbits(self):
+        """
+        Orbit representatives (sorted) and their periods under translation
+
+        The basis is walked in chunks of self.chunk_size like hamiltonian(),
+        so only the representatives (about d^N / N of them) are kept whole.
+        """
+        representatives, periods = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+        for start in range(0, self.size, self.chunk_size):
+            configs = np.arange(start, min(start + self.chunk_size, self.size), dtype=np.int64)
+            chunk = configs[self._canonical(configs)[0] == configs]
+
+            period = np.zeros(chunk.size, dtype=np.int64)
+            current = chunk
+            for shift in range(1, self.n_sites + 1):
+                current = self._translate(current)
+                period[(period == 0) & (current == chunk)] = shift
+            representatives.append(chunk)
+            periods.append(period)
+        return np.concatenate(representatives), np.concatenate(periods)
+
+    def momentum_sector(self, momentum):
+        """
+        Block of H at crystal momentum k = 2π momentum / N (periodic chains)
+
+        Uses the basis |a(k)⟩ ∝ Σ_l e^(-ikl) T^l |a⟩ over translation orbit
+        representatives a whose period R satisfies k R ≡ 0 (mod 2π). Then
+        ⟨b(k)|H|a(k)⟩ collects h_ba e^(ik l_b) sqrt(R_a / R_b) for every
+        image T^(l_b)|b⟩ of |a⟩ under a bond term.
+
+        Returns:
+            (CSR block, representatives, periods) of the sector
+        """
+        if not self.periodic:
+            raise ValueError("Momentum sectors require a periodic chain")
+        N = self.n_sites
+        representatives, periods = self.translation_orbits
+        allowed = (momentum * periods) % N == 0
+        representatives, periods = representatives[allowed], periods[allowed]
+        k = 2 * np.pi * momentum / N
+
+        rows, cols, data = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)], [np.empty(0)]
+        for start in range(0, representatives.size, self.chunk_size):
+            chunk = representatives[start:start + self.chunk_size]
+            for site_1, site_2 in self.bonds:
+                sources, targets, values = self._bond_action(chunk, site_1, site_2)
+                sources += start
+                target_reps, shifts = self._canonical(targets)
+                position = np.searchsorted(representatives, target_reps)
+                position = np.minimum(position, max(representatives.size - 1, 0))
+                inside = representatives[position] == target_reps
+                rows.append(position[inside])
+                cols.append(sources[inside])
+                data.append(values[inside] * np.exp(1j * k * shifts[inside])
+                            * np.sqrt(periods[sources[inside]] / periods[position[inside]]))
+
+        size = representatives.size
+        block = sp.coo_matrix((np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+                              shape=(size, size)).tocsr()
+        return block, representatives, periods
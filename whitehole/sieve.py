@@ -0,0 +1,265 @@
+"""
+Segmented prime sieve engine behind the cosmic blink pattern
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Odd numbers covered by one sieve segment. The byte-per-odd working buffer
+# (256 KiB) stays resident in L2 while every base prime is crossed off.
+SEGMENT_ODDS = 1 << 18
+
+# Small odd primes removed by copying a precomputed wheel pattern instead of
+# striding over the segment once per prime.
+_PRESIEVE_PRIMES = (3, 5, 7, 11, 13)
+_PRESIEVE_PERIOD = 3 * 5 * 7 * 11 * 13
+
+
+def _presieve_pattern():
+    """Odd-index pattern with multiples of the pre-sieve primes cleared"""
+    # Odd number m = 2k + 1 is divisible by p exactly when k ≡ (p - 1)/2 (mod p)
+    pattern = np.ones(_PRESIEVE_PERIOD, dtype=bool)
+    for p in _PRESIEVE_PRIMES:
+        pattern[(p - 1) // 2::p] = False
+    return pattern
+
+
+_PATTERN = _presieve_pattern()
+
+
+def prime_dtype(n_max):
+    """Smallest signed integer dtype able to hold every prime up to n_max"""
+    return np.dtype(np.int32) if n_max < 2**31 else np.dtype(np.int64)
+
+
+def small_primes(limit):
+    """
+    Primes up to and including limit with a single odd-only sieve
+
+    Used for the base primes up to sqrt(n), which always fit in memory.
+    """
+    if limit < 2:
+        return np.empty(0, dtype=np.int64)
+
+    # Index k represents the odd number 2k + 1
+    sieve = np.ones((limit + 1) // 2, dtype=bool)
+    sieve[0] = False
+    for k in range(1, (math.isqrt(limit) - 1) // 2 + 1):
+        if sieve[k]:
+            p = 2 * k + 1
+            sieve[p * p // 2::p] = False
+
+    odd_primes = 2 * np.flatnonzero(sieve).astype(np.int64) + 1
+    return np.concatenate(([2], odd_primes)).astype(np.int64)
+
+
+def prime_count(x):
+    """
+    Number of primes up to x, π(x), without sieving to x
+
+    Lucy Hedgehog's variant of the Legendre/Meissel recursion: it tracks
+    the count of unsieved integers at every value x // i, vectorizing the
+    update for each prime p up to sqrt(x). Runs in O(x^(3/4)) time and
+    O(sqrt(x)) memory, so π(10^12) takes seconds.
+    """
+    x = int(x)
+    if x < 2:
+        return 0
+
+    r = math.isqrt(x)
+    # small[v] counts survivors in [2, v]; large[i] counts survivors in [2, x // i]
+    small = np.arange(-1, r, dtype=np.int64)
+    large = np.empty(r + 1, dtype=np.int64)
+    large[1:] = x // np.arange(1, r + 1, dtype=np.int64) - 1
+
+    for p in range(2, r + 1):
+        if small[p] == small[p - 1]:
+            continue  # p is composite
+        survivors_below_p = small[p - 1]
+        p2 = p * p
+
+        # Values x // i with i*p within sqrt(x) come from large, the rest from small
+        limit = min(r, x // p2)
+        d = np.arange(1, limit + 1, dtype=np.int64) * p
+        removed = np.empty(limit, dtype=np.int64)
+        near = d <= r
+        removed[near] = large[d[near]]
+        removed[~near] = small[x // d[~near]]
+        large[1:limit + 1] -= removed - survivors_below_p
+
+        if p2 <= r:
+            v = np.arange(p2, r + 1, dtype=np.int64)
+            small[p2:] -= small[v // p] - survivors_below_p
+
+    return int(large[1])
+
+
+def nth_prime_upper_bound(n):
+    """
+    Upper bound for the nth prime (1-based)
+
+    Rosser's p_n < n(ln n + ln ln n) for n >= 6, tightened to Dusart's
+    p_n <= n(ln n + ln ln n - 0.9484) for n >= 39017.
+    """
+    n = int(n)
+    if n < 6:
+        return (0, 2, 3, 5, 7, 11)[max(n, 0)]
+
+    log_n = math.log(n)
+    correction = 0.9484 if n >= 39017 else 0.0
+    return int(n * (log_n + math.log(log_n) - correction)) + 1
+
+
+def nth_prime(n):
+    """The nth prime (1-based) from a single sieve sized by the upper bound"""
+    if n < 1:
+        raise ValueError("n must be at least 1")
+    return int(primes_in_range(2, nth_prime_upper_bound(n) + 1)[n - 1])
+
+
+class SegmentSieve:
+    """
+    Reusable working set for sieving consecutive odd-only segments
+
+    Args:
+        base_primes: Primes covering at least sqrt of the largest bound sieved
+        segment_odds: Odd numbers per segment (working set size in bytes)
+    """
+
+    def __init__(self, base_primes, segment_odds=SEGMENT_ODDS):
+        self.segment_odds = int(segment_odds)
+        self.base_primes = np.asarray(base_primes, dtype=np.int64)
+        self._sieving = self.base_primes[self.base_primes > _PRESIEVE_PRIMES[-1]]
+        self._buffer = np.empty(self.segment_odds, dtype=bool)
+        self._tile = np.resize(_PATTERN, self.segment_odds + _PRESIEVE_PERIOD)
+
+    def primes(self, lo, hi):
+        """
+        Primes in [lo, hi) for a range spanning at most one segment
+
+        Returns:
+            int64 array of primes in increasing order
+        """
+        first_odd = max(lo, 1) | 1
+        count = (hi - first_odd + 1) // 2
+        if count <= 0:
+            return np.array([p for p in (2,) if lo <= p < hi], dtype=np.int64)
+        if count > self.segment_odds:
+            raise ValueError("Range exceeds the segment size")
+
+        k0 = (first_odd - 1) // 2
+        offset = k0 % _PRESIEVE_PERIOD
+        buf = self._buffer[:count]
+        buf[:] = self._tile[offset:offset + count]
+
+        # First odd multiple of each base prime inside the segment, never below p^2
+        p = self._sieving[self._sieving * self._sieving < hi]
+        start = np.maximum(p * p, (first_odd + p - 1) // p * p)
+        start += (start % 2 == 0) * p
+        for index, step in zip(((start - first_odd) // 2).tolist(), p.tolist()):
+            buf[index::step] = False
+
+        if first_odd == 1:
+            buf[0] = False  # 1 is not prime
+
+        found = first_odd + 2 * np.flatnonzero(buf).astype(np.int64)
+        if lo > _PRESIEVE_PRIMES[-1]:
+            return found
+
+        wheel = [q for q in (2,) + _PRESIEVE_PRIMES if lo <= q < hi]
+        return np.concatenate((np.array(wheel, dtype=np.int64), found))
+
+    def iter_range(self, lo, hi):
+        """Yield primes in [lo, hi) one segment at a time"""
+        span = 2 * self.segment_odds
+        for seg_lo in range(lo, hi, span):
+            yield self.primes(seg_lo, min(seg_lo + span, hi))
+
+
+def iter_primes(lo=2, hi=None, segment_odds=SEGMENT_ODDS):
+    """
+    Yield primes in [lo, hi) one segment at a time
+
+    With hi=None the sieve never stops; base primes are extended by
+    doubling whenever the next segment outgrows them.
+    """
+    lo = max(int(lo), 2)
+    span = 2 * int(segment_odds)
+    base_limit = 0 if hi is None else math.isqrt(int(hi))
+    sieve = None
+
+    seg_lo = lo
+    while hi is None or seg_lo < hi:
+        seg_hi = seg_lo + span if hi is None else min(seg_lo + span, hi)
+        if sieve is None or base_limit * base_limit < seg_hi:
+            base_limit = max(base_limit, math.isqrt(seg_hi) + 1, 2 * base_limit)
+            sieve = SegmentSieve(small_primes(base_limit), segment_odds)
+        yield sieve.primes(seg_lo, seg_hi)
+        seg_lo = seg_hi
+
+
+def resolve_workers(workers):
+    """Number of worker processes; None means serial, -1 means all cores"""
+    if workers is None:
+        return 1
+    if workers < 0:
+        return max((os.cpu_count() or 1) + 1 + workers, 1)
+    return max(int(workers), 1)
+
+
+# Sieve owned by each pool process, built once from the shared base primes
+_worker_sieve = None
+
+
+def _init_worker(base_primes, segment_odds):
+    global _worker_sieve
+    _worker_sieve = SegmentSieve(base_primes, segment_odds)
+
+
+def _sieve_block(bounds):
+    lo, hi, dtype = bounds
+    chunks = list(_worker_sieve.iter_range(lo, hi))
+    return np.concatenate(chunks).astype(dtype, copy=False)
+
+
+def _parallel_blocks(lo, hi, segment_odds, n_workers):
+    """Split [lo, hi) into whole-segment blocks, several per worker"""
+    span = 2 * segment_odds
+    n_segments = -(-(hi - lo) // span)
+    per_block = max(-(-n_segments // (4 * n_workers)), 1)
+    step = per_block * span
+    return [(start, min(start + step, hi)) for start in range(lo, hi, step)]
+
+
+def primes_in_range(lo, hi, segment_odds=SEGMENT_ODDS, workers=None):
+    """
+    Primes in [lo, hi) using a segmented, odd-only sieve
+
+    Memory is bounded by the output plus one segment and the base primes.
+    With several workers, blocks of segments are sieved in a process pool
+    that only receives the base primes, and results are stitched in order.
+    """
+    lo = max(int(lo), 2)
+    hi = int(hi)
+    dtype = prime_dtype(hi)
+    if hi <= lo:
+        return np.empty(0, dtype=dtype)
+
+    base = small_primes(math.isqrt(hi))
+    n_workers = resolve_workers(workers)
+    blocks = _parallel_blocks(lo, hi, segment_odds, n_workers)
+
+    if n_workers == 1 or len(blocks) == 1:
+        sieve = SegmentSieve(base, segment_odds)
+        chunks = list(sieve.iter_range(lo, hi))
+        return np.concatenate(chunks).astype(dtype, copy=False)
+
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(blocks)),
+                             initializer=_init_worker,
+                             initargs=(base, segment_odds)) as executor:
+        chunks = list(executor.map(_sieve_block, [(b_lo, b_hi, dtype) for b_lo, b_hi in blocks]))
+
+    return np.concatenate(chunks)
@@ -1,129 +1,86 @@
 """
-
 Visualization tools for WhiteHole framework
-
 - Penrose diagrams, tesseract projections, CMB analysis, phase diagrams
-
 """
 
 import numpy as np
-
 import matplotlib.pyplot as plt
-
 from matplotlib import cm
-
 from mpl_toolkits.mplot3d import Axes3D
 
-class PenroseDiagramPlotter:
-
-"""Render Penrose (Kruskal) spacetime diagrams"""
-
-def __init__(self, mass=1.0):
-
-self.M = mass
-
-self.r_s = 2 * mass
-
-def plot_penrose_diagram(self, ax=None, resolution=200):
-
-"""Plot Penrose diagram showing black hole and white hole regions"""
-
-if ax is None:
-
-fig, ax = plt.subplots(figsize=(10, 10))
-
-# Event horizons
-
-ax.plot([-1, 1], [-1, 1], 'r-', linewidth=2, label='Event Horizon (BH)')
-
-ax.plot([-1, 1], [1, -1], 'b-', linewidth=2, label='Event Horizon (WH)')
-
-# Singularities
-
-ax.plot(0, 0, 'k*', markersize=20, label='Singularities')
-
-# Regions
-
-ax.text(-1.5, 0, 'Region I\\n(External)', fontsize=10, ha='center')
-
-ax.text(0, -1.5, 'Region II\\n(Black Hole)', fontsize=10, ha='center', color='red')
 
-ax.text(1.5, 0, 'Region III\\n(Parallel)', fontsize=10, ha='center')
-
-ax.text(0, 1.5, 'Region IV\\n(White Hole)', fontsize=10, ha='center', color='blue')
-
-ax.set_xlim(-2, 2)
+class PenroseDiagramPlotter:
+    """Render Penrose (Kruskal) spacetime diagrams"""
 
-ax.set_ylim(-2, 2)
+    def __init__(self, mass=1.0):
+        self.M = mass
+        self.r_s = 2 * mass
 
-ax.set_xlabel('Kruskal u', fontsize=12)
+    def plot_penrose_diagram(self, ax=None, resolution=200):
+        """Plot Penrose diagram showing black hole and white hole regions"""
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(10, 10))
 
-ax.set_ylabel('Kruskal v', fontsize=12)
+        # Event horizons
+        ax.plot([-1, 1], [-1, 1], 'r-', linewidth=2, label='Event Horizon (BH)')
+        ax.plot([-1, 1], [1, -1], 'b-', linewidth=2, label='Event Horizon (WH)')
 
-ax.set_title('Penrose Diagram: Extended Schwarzschild', fontsize=14)
+        # Singularities
+        ax.plot(0, 0, 'k*', markersize=20, label='Singularities')
 
-ax.legend(loc='upper right')
+        # Regions
+        ax.text(-1.5, 0, 'Region I\\n(External)', fontsize=10, ha='center')
+        ax.text(0, -1.5, 'Region II\\n(Black Hole)', fontsize=10, ha='center', color='red')
+        ax.text(1.5, 0, 'Region III\\n(Parallel)', fontsize=10, ha='center')
+        ax.text(0, 1.5, 'Region IV\\n(White Hole)', fontsize=10, ha='center', color='blue')
 
-ax.grid(True, alpha=0.3)
+        ax.set_xlim(-2, 2)
+        ax.set_ylim(-2, 2)
+        ax.set_xlabel('Kruskal u', fontsize=12)
+        ax.set_ylabel('Kruskal v', fontsize=12)
+        ax.set_title('Penrose Diagram: Extended Schwarzschild', fontsize=14)
+        ax.legend(loc='upper right')
+        ax.grid(True, alpha=0.3)
+        ax.set_aspect('equal')
 
-ax.set_aspect('equal')
+        return ax
 
-return ax
 
 class CMBAnalysisPlotter:
+    """Plot CMB power spectrum"""
 
-"""Plot CMB power spectrum"""
-
-@staticmethod
-
-def plot_cmb_spectrum(ell, ax=None):
-
-"""Plot CMB angular power spectrum"""
-
-if ax is None:
-
-fig, ax = plt.subplots(figsize=(12, 6))
-
-# Mock spectrum
-
-reference = 5000 * np.exp(-(ell - 220)**2 / 10000) + 1000 * np.exp(-(ell - 550)**2 / 22500)
-
-ax.plot(ell, reference, 'k-', linewidth=2, label='Standard Model')
+    @staticmethod
+    def plot_cmb_spectrum(ell, ax=None):
+        """Plot CMB angular power spectrum"""
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(12, 6))
 
-ax.set_xlabel('Multipole Moment ℓ')
+        # Mock spectrum
+        reference = 5000 * np.exp(-(ell - 220)**2 / 10000) + 1000 * np.exp(-(ell - 550)**2 / 22500)
+        ax.plot(ell, reference, 'k-', linewidth=2, label='Standard Model')
 
-ax.set_ylabel('Power C_ℓ')
+        ax.set_xlabel('Multipole Moment ℓ')
+        ax.set_ylabel('Power C_ℓ')
+        ax.set_title('CMB Power Spectrum')
+        ax.grid(True, alpha=0.3)
+        ax.legend()
 
-ax.set_title('CMB Power Spectrum')
+        return ax
 
-ax.grid(True, alpha=0.3)
-
-ax.legend()
-
-return ax
 
 class PrimeGapVisualizer:
+    """Visualize prime gap patterns"""
 
-"""Visualize prime gap patterns"""
-
-@staticmethod
-
-def plot_gaps(gaps, ax=None):
-
-"""Plot prime gaps"""
-
-if ax is None:
-
-fig, ax = plt.subplots(figsize=(12, 5))
-
-ax.plot(gaps, 'b-', linewidth=1)
-
-ax.set_xlabel('Prime Index')
-
-ax.set_ylabel('Gap Size')
-
-ax.set_title('Prime Gap Sequence')
+    @staticmethod
+    def plot_gaps(gaps, ax=None):
+        """Plot prime gaps"""
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(12, 5))
 
-ax.grid(True, alpha=0.3)
+        ax.plot(gaps, 'b-', linewidth=1)
+        ax.set_xlabel('Prime Index')
+        ax.set_ylabel('Gap Size')
+        ax.set_title('Prime Gap Sequence')
+        ax.grid(True, alpha=0.3)
 
-return ax
\ No newline at end of file
+        return ax